@@ -114,6 +114,8 @@ class LoggerMixin:
                 self._logger.info("Doing something")
     """
     
+    __slots__ = ()
+    
     @property
     def _logger(self) -> logging.Logger:
         """Get logger for this class."""
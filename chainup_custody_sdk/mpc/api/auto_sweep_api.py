@@ -1,8 +1,9 @@
 """
 Auto Sweep API - MPC auto-sweep management operations
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterator, List
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 
 
 class AutoSweepApi(MpcBaseApi):
@@ -11,6 +12,8 @@ class AutoSweepApi(MpcBaseApi):
     Provides methods for configuring and querying auto-sweep operations.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new AutoSweepApi instance.
@@ -81,7 +84,7 @@ class AutoSweepApi(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def sync_auto_collect_records(self, max_id: int = 0) -> Dict[str, Any]:
+    def sync_auto_collect_records(self, max_id: int = 0) -> List[Dict[str, Any]]:
         """
         Synchronizes auto sweeping records.
         Retrieve up to 100 sweeping records for all wallets under a workspace.
@@ -100,3 +103,25 @@ class AutoSweepApi(MpcBaseApi):
             {"max_id": max_id},
         )
         return self.validate_response(response)
+
+    def iter_auto_collect_records(
+        self, start_max_id: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all auto-sweep records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Auto-sweep records
+
+        Example:
+            for record in auto_sweep_api.iter_auto_collect_records():
+                print(record['symbol'])
+        """
+        return iter_sync_records(self.sync_auto_collect_records, start_max_id)
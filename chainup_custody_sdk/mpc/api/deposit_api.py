@@ -1,8 +1,9 @@
 """
 Deposit API - MPC deposit management operations
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Iterable
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 
 
 class DepositApi(MpcBaseApi):
@@ -11,6 +12,8 @@ class DepositApi(MpcBaseApi):
     Provides methods for querying deposit records.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new DepositApi instance.
@@ -20,7 +23,7 @@ class DepositApi(MpcBaseApi):
         """
         super().__init__(config)
 
-    def get_deposit_records(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def get_deposit_records(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Gets receiving records.
 
@@ -44,7 +47,29 @@ class DepositApi(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def sync_deposit_records(self, max_id: int = 0) -> Dict[str, Any]:
+    def get_deposit_records_bulk(
+        self, ids: Iterable[Any], chunk: int = MpcBaseApi.RECORD_IDS_CHUNK
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets deposit records for any number of IDs.
+        Splits the IDs into requests of ``chunk`` (the API limit is 100) and
+        runs up to four of them concurrently.
+
+        Args:
+            ids: Receiving IDs
+            chunk: Maximum number of IDs per request (default: 100)
+
+        Returns:
+            Deposit records, batch by batch in the order of ids
+
+        Example:
+            records = deposit_api.get_deposit_records_bulk(deposit_ids)
+        """
+        return self._get_records_bulk(
+            lambda batch: self.get_deposit_records({"ids": batch}), ids, chunk
+        )
+
+    def sync_deposit_records(self, max_id: int = 0) -> List[Dict[str, Any]]:
         """
         Synchronizes transfer(deposit) records.
 
@@ -61,3 +86,23 @@ class DepositApi(MpcBaseApi):
             "/api/mpc/billing/sync_deposit_list", {"max_id": max_id}
         )
         return self.validate_response(response)
+
+    def iter_deposit_records(self, start_max_id: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all deposit records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Deposit records
+
+        Example:
+            for deposit in deposit_api.iter_deposit_records():
+                print(deposit['txid'])
+        """
+        return iter_sync_records(self.sync_deposit_records, start_max_id)
@@ -3,15 +3,21 @@ MPC Base API - Base class for all MPC API implementations
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import time
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, List, Optional, Union, TYPE_CHECKING
 
 from chainup_custody_sdk.utils.mpc_http_client import MpcHttpClient
+from chainup_custody_sdk.utils import json_util
 from chainup_custody_sdk.utils.crypto_provider import RsaCryptoProvider
+from chainup_custody_sdk.utils.ttl_cache import get_response_cache
 from chainup_custody_sdk.exceptions import ApiError, CryptoError, NetworkError
 from chainup_custody_sdk.logger import LoggerMixin
 
+if TYPE_CHECKING:
+    from chainup_custody_sdk.utils.async_mpc_http_client import AsyncMpcHttpClient
+
 
 class MpcBaseApi(LoggerMixin):
     """
@@ -23,7 +29,18 @@ class MpcBaseApi(LoggerMixin):
     - Response: decrypt data field with public key
     """
     
-    __slots__ = ("config", "http_client", "crypto_provider")
+    __slots__ = (
+        "config",
+        "http_client",
+        "crypto_provider",
+        "response_cache",
+        "_async_http_client",
+    )
+
+    # IDs per request in the *_bulk record lookups (the API accepts up to 100)
+    RECORD_IDS_CHUNK = 100
+    # Maximum number of lookup requests in flight in the *_bulk record lookups
+    RECORD_QUERY_WORKERS = 4
 
     def __init__(self, config) -> None:
         """
@@ -33,7 +50,9 @@ class MpcBaseApi(LoggerMixin):
             config: MpcConfig object
         """
         self.config = config
-        self.http_client = MpcHttpClient(config)
+        self.http_client = MpcHttpClient.shared(config)
+        self._async_http_client: Optional[AsyncMpcHttpClient] = None
+        self.response_cache = get_response_cache(config)
 
         # Use custom crypto provider or create default RSA provider
         if config.crypto_provider:
@@ -59,9 +78,16 @@ class MpcBaseApi(LoggerMixin):
         Returns:
             JSON string of request args
         """
-        data = data or {}
-        args = {**data, "time": int(time.time() * 1000), "charset": "utf-8"}
-        return json.dumps(args)
+        timestamp = int(time.time() * 1000)
+        if not data:
+            # Only the timestamp changes, so skip building and serializing a dict
+            return '{"time":' + str(timestamp) + ',"charset":"utf-8"}'
+
+        args = dict(data)
+        args["time"] = timestamp
+        args["charset"] = "utf-8"
+        # Compact separators keep the RSA-encrypted payload (and block count) minimal
+        return json_util.dumps(args)
 
     def _execute_request(
         self, method: str, path: str, data: Optional[Dict[str, Any]] = None
@@ -91,14 +117,14 @@ class MpcBaseApi(LoggerMixin):
         # Step 1: Build request args JSON (matches Java SDK args.toJson())
         raw_json = self._build_request_args(data)
 
-        self._logger.debug(f"Request args: {raw_json}")
+        self._logger.debug("Request args: %s", raw_json)
 
         # Step 2: Encrypt with private key (matches Java SDK dataCrypto.encode(raw))
         encrypted_data = ""
         if self.crypto_provider:
             try:
                 encrypted_data = self.crypto_provider.encrypt_with_private_key(raw_json)
-                self._logger.debug(f"Encrypted data: {encrypted_data[:100]}...")
+                self._logger.debug("Encrypted data: %.100s...", encrypted_data)
             except Exception as e:
                 raise CryptoError(f"Failed to encrypt request data: {str(e)}")
 
@@ -108,9 +134,21 @@ class MpcBaseApi(LoggerMixin):
         except RuntimeError as e:
             raise NetworkError(str(e))
 
-        self._logger.debug(f"Response: {response}")
+        self._logger.debug("Response: %s", response)
 
         # Step 4: Check if response has encrypted data field and decrypt
+        return self._decrypt_response(response)
+
+    def _decrypt_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Decrypts the data field of an MPC response if it is encrypted.
+
+        Args:
+            response: Parsed HTTP response
+
+        Returns:
+            Decrypted response, or the response as-is if not encrypted
+        """
         if response and "data" in response and isinstance(response["data"], str):
             # MPC API returns encrypted data, need to decrypt with public key
             if self.crypto_provider:
@@ -118,17 +156,115 @@ class MpcBaseApi(LoggerMixin):
                     decrypted = self.crypto_provider.decrypt_with_public_key(
                         response["data"]
                     )
-                    self._logger.debug(f"Decrypted: {decrypted}")
+                    self._logger.debug("Decrypted: %s", decrypted)
                     # Parse decrypted JSON and return complete response
-                    decrypted_data = json.loads(decrypted)
+                    decrypted_data = json_util.loads(decrypted)
                     return decrypted_data
                 except Exception as e:
-                    self._logger.warning(f"Decrypt error: {str(e)}")
+                    self._logger.warning("Decrypt error: %s", e)
                     # If decryption fails, might be an error response, return as-is
                     return response
 
         return response
 
+    @property
+    def async_http_client(self) -> AsyncMpcHttpClient:
+        """
+        Gets the async HTTP client, creating it on first use.
+        Requires the optional ``aiohttp`` dependency.
+
+        Returns:
+            AsyncMpcHttpClient instance
+        """
+        if self._async_http_client is None:
+            from chainup_custody_sdk.utils.async_mpc_http_client import AsyncMpcHttpClient
+            self._async_http_client = AsyncMpcHttpClient(self.config)
+        return self._async_http_client
+
+    async def _execute_request_async(
+        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executes an MPC API request asynchronously.
+
+        Same flow as _execute_request, but the HTTP call is awaited on the event
+        loop while the CPU-bound RSA encryption/decryption runs in the default
+        thread pool executor, so many requests can be in flight concurrently.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data
+
+        Returns:
+            API response (decrypted if encrypted)
+
+        Raises:
+            CryptoError: If encryption fails
+            NetworkError: If HTTP request fails
+        """
+        loop = asyncio.get_running_loop()
+        raw_json = self._build_request_args(data)
+
+        self._logger.debug("Request args: %s", raw_json)
+
+        encrypted_data = ""
+        if self.crypto_provider:
+            try:
+                encrypted_data = await loop.run_in_executor(
+                    None, self.crypto_provider.encrypt_with_private_key, raw_json
+                )
+            except Exception as e:
+                raise CryptoError(f"Failed to encrypt request data: {str(e)}")
+
+        try:
+            response = await self.async_http_client.request_json(
+                method, path, encrypted_data
+            )
+        except RuntimeError as e:
+            raise NetworkError(str(e))
+
+        self._logger.debug("Response: %s", response)
+
+        return await loop.run_in_executor(None, self._decrypt_response, response)
+
+    async def post_async(
+        self, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executes a POST request asynchronously.
+
+        Args:
+            path: API path
+            data: Request data
+
+        Returns:
+            API response
+        """
+        return await self._execute_request_async("POST", path, data)
+
+    async def get_async(
+        self, path: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Executes a GET request asynchronously.
+
+        Args:
+            path: API path
+            data: Request data
+
+        Returns:
+            API response
+        """
+        return await self._execute_request_async("GET", path, data)
+
+    async def close_async(self) -> None:
+        """
+        Closes the async HTTP client session, if one was opened.
+        """
+        if self._async_http_client is not None:
+            await self._async_http_client.close()
+
     def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Executes a POST request.
@@ -155,6 +291,37 @@ class MpcBaseApi(LoggerMixin):
         """
         return self._execute_request("GET", path, data)
 
+    def _get_records_bulk(
+        self,
+        fetch: Callable[[List[Any]], List[Dict[str, Any]]],
+        ids: Iterable[Any],
+        chunk: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Looks up records for any number of IDs.
+        IDs are sent in batches of ``chunk`` per request; when there is more
+        than one batch, up to RECORD_QUERY_WORKERS are queried concurrently.
+
+        Args:
+            fetch: Lookup method taking one batch (list) of IDs
+            ids: IDs to look up
+            chunk: Maximum number of IDs per request
+
+        Returns:
+            Records, batch by batch in the order of ids
+        """
+        ids = list(ids)
+        batches = [ids[i:i + chunk] for i in range(0, len(ids), chunk)]
+        if len(batches) <= 1:
+            return (fetch(batches[0]) or []) if batches else []
+
+        workers = min(self.RECORD_QUERY_WORKERS, len(batches))
+        results: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for records in executor.map(fetch, batches):
+                results.extend(records or [])
+        return results
+
     def validate_response(self, response: Union[Dict[str, Any], str]) -> Any:
         """
         Validates response and handles errors.
@@ -175,8 +342,8 @@ class MpcBaseApi(LoggerMixin):
         """
         if isinstance(response, str):
             try:
-                response = json.loads(response)
-            except json.JSONDecodeError as e:
+                response = json_util.loads(response)
+            except json_util.JSONDecodeError as e:
                 raise ApiError(f"Invalid JSON response: {response}")
 
         code = response.get("code")
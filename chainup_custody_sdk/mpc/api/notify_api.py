@@ -3,7 +3,7 @@ Notify API - MPC notification handling operations
 """
 from typing import Optional
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
-import json
+from chainup_custody_sdk.utils import json_util
 
 
 class NotifyApi(MpcBaseApi):
@@ -12,6 +12,8 @@ class NotifyApi(MpcBaseApi):
     Provides methods for decrypting MPC async notifications (webhooks).
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new NotifyApi instance.
@@ -57,14 +59,14 @@ class NotifyApi(MpcBaseApi):
                 return None
 
             # Parse JSON to notification arguments
-            notify = json.loads(raw)
+            notify = json_util.loads(raw)
             if not notify:
                 print("[MpcNotify] JSON decode returned None")
                 return None
 
             return notify
 
-        except json.JSONDecodeError as e:
+        except json_util.JSONDecodeError as e:
             print(f"[MpcNotify] JSON decode error: {str(e)}")
             return None
         except Exception as e:
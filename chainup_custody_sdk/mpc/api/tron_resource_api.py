@@ -1,8 +1,9 @@
 """
 Tron Resource API - TRON resource delegation operations
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator, Iterable
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 
 
 class TronResourceApi(MpcBaseApi):
@@ -11,6 +12,8 @@ class TronResourceApi(MpcBaseApi):
     Provides methods for buying and querying TRON network resources (Energy/Bandwidth).
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new TronResourceApi instance.
@@ -70,7 +73,7 @@ class TronResourceApi(MpcBaseApi):
         response = self.post("/api/mpc/tron/delegate", params)
         return self.validate_response(response)
 
-    def get_buy_resource_records(self, request_ids: List[str]) -> Dict[str, Any]:
+    def get_buy_resource_records(self, request_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Gets buy resource records.
         Get delegation records by request IDs.
@@ -95,7 +98,27 @@ class TronResourceApi(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def sync_buy_resource_records(self, max_id: int = 0) -> Dict[str, Any]:
+    def get_buy_resource_records_bulk(
+        self, ids: Iterable[Any], chunk: int = MpcBaseApi.RECORD_IDS_CHUNK
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets delegation records for any number of IDs.
+        Splits the IDs into requests of ``chunk`` (the API limit is 100) and
+        runs up to four of them concurrently.
+
+        Args:
+            ids: Request IDs
+            chunk: Maximum number of IDs per request (default: 100)
+
+        Returns:
+            Delegation records, batch by batch in the order of ids
+
+        Example:
+            records = tron_resource_api.get_buy_resource_records_bulk(request_ids)
+        """
+        return self._get_records_bulk(self.get_buy_resource_records, ids, chunk)
+
+    def sync_buy_resource_records(self, max_id: int = 0) -> List[Dict[str, Any]]:
         """
         Synchronizes buy resource records.
         Get all delegation records, maximum of 100 records.
@@ -113,3 +136,25 @@ class TronResourceApi(MpcBaseApi):
             "/api/mpc/tron/delegate/sync_trans_list", {"max_id": max_id or 0}
         )
         return self.validate_response(response)
+
+    def iter_buy_resource_records(
+        self, start_max_id: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all TRON resource purchase records after start_max_id,
+        following pagination. The next page is fetched in the background
+        while the current one is being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            TRON resource purchase records
+
+        Example:
+            for record in tron_api.iter_buy_resource_records():
+                print(record['request_id'])
+        """
+        return iter_sync_records(self.sync_buy_resource_records, start_max_id)
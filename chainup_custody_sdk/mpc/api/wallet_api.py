@@ -12,6 +12,8 @@ class WalletApi(MpcBaseApi):
     Uses snake_case naming for parameters (same as Java SDK).
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new WalletApi instance.
@@ -1,8 +1,9 @@
 """
 Web3 API - MPC Web3 transaction operations
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Iterator, Iterable, List
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 from chainup_custody_sdk.utils.mpc_sign_util import MpcSignUtil
 
 
@@ -12,6 +13,8 @@ class Web3Api(MpcBaseApi):
     Provides methods for creating, accelerating, and querying Web3 transactions.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new Web3Api instance.
@@ -173,7 +176,7 @@ class Web3Api(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def get_web3_trans_records(self, request_ids: list) -> Dict[str, Any]:
+    def get_web3_trans_records(self, request_ids: list) -> List[Dict[str, Any]]:
         """
         Gets Web3 transaction records.
 
@@ -197,7 +200,27 @@ class Web3Api(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def sync_web3_trans_records(self, max_id: int = 0) -> Dict[str, Any]:
+    def get_web3_trans_records_bulk(
+        self, ids: Iterable[Any], chunk: int = MpcBaseApi.RECORD_IDS_CHUNK
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets Web3 transaction records for any number of IDs.
+        Splits the IDs into requests of ``chunk`` (the API limit is 100) and
+        runs up to four of them concurrently.
+
+        Args:
+            ids: Request IDs
+            chunk: Maximum number of IDs per request (default: 100)
+
+        Returns:
+            Web3 transaction records, batch by batch in the order of ids
+
+        Example:
+            records = web3_api.get_web3_trans_records_bulk(request_ids)
+        """
+        return self._get_records_bulk(self.get_web3_trans_records, ids, chunk)
+
+    def sync_web3_trans_records(self, max_id: int = 0) -> List[Dict[str, Any]]:
         """
         Synchronizes Web3 transaction records.
 
@@ -214,3 +237,23 @@ class Web3Api(MpcBaseApi):
             "/api/mpc/web3/sync_trans_list", {"max_id": max_id}
         )
         return self.validate_response(response)
+
+    def iter_web3_trans_records(self, start_max_id: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all Web3 transaction records after start_max_id,
+        following pagination. The next page is fetched in the background
+        while the current one is being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Web3 transaction records
+
+        Example:
+            for record in web3_api.iter_web3_trans_records():
+                print(record['request_id'])
+        """
+        return iter_sync_records(self.sync_web3_trans_records, start_max_id)
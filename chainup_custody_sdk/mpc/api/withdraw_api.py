@@ -1,8 +1,9 @@
 """
 Withdraw API - MPC withdrawal management operations
 """
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator, Iterable
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 from chainup_custody_sdk.utils.mpc_sign_util import MpcSignUtil
 
 
@@ -12,6 +13,8 @@ class WithdrawApi(MpcBaseApi):
     Provides methods for initiating withdrawals and querying withdrawal records.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new WithdrawApi instance.
@@ -119,7 +122,7 @@ class WithdrawApi(MpcBaseApi):
         response = self.post("/api/mpc/billing/withdraw", request_data)
         return self.validate_response(response)
 
-    def get_withdraw_records(self, request_ids: list) -> Dict[str, Any]:
+    def get_withdraw_records(self, request_ids: list) -> List[Dict[str, Any]]:
         """
         Gets transfer records.
 
@@ -142,7 +145,27 @@ class WithdrawApi(MpcBaseApi):
         )
         return self.validate_response(response)
 
-    def sync_withdraw_records(self, max_id: int = 0) -> Dict[str, Any]:
+    def get_withdraw_records_bulk(
+        self, ids: Iterable[Any], chunk: int = MpcBaseApi.RECORD_IDS_CHUNK
+    ) -> List[Dict[str, Any]]:
+        """
+        Gets withdrawal records for any number of IDs.
+        Splits the IDs into requests of ``chunk`` (the API limit is 100) and
+        runs up to four of them concurrently.
+
+        Args:
+            ids: Request IDs
+            chunk: Maximum number of IDs per request (default: 100)
+
+        Returns:
+            Withdrawal records, batch by batch in the order of ids
+
+        Example:
+            records = withdraw_api.get_withdraw_records_bulk(request_ids)
+        """
+        return self._get_records_bulk(self.get_withdraw_records, ids, chunk)
+
+    def sync_withdraw_records(self, max_id: int = 0) -> List[Dict[str, Any]]:
         """
         Synchronizes transfer(withdraw) records.
 
@@ -159,3 +182,23 @@ class WithdrawApi(MpcBaseApi):
             "/api/mpc/billing/sync_withdraw_list", {"max_id": max_id}
         )
         return self.validate_response(response)
+
+    def iter_withdraw_records(self, start_max_id: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates over all withdrawal records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Withdrawal records
+
+        Example:
+            for withdrawal in withdraw_api.iter_withdraw_records():
+                print(withdrawal['request_id'])
+        """
+        return iter_sync_records(self.sync_withdraw_records, start_max_id)
@@ -3,6 +3,7 @@ WorkSpace API - MPC workspace management operations
 """
 from typing import Dict, Any, Optional
 from chainup_custody_sdk.mpc.api.mpc_base_api import MpcBaseApi
+from chainup_custody_sdk.utils.ttl_cache import cached_response
 
 
 class WorkSpaceApi(MpcBaseApi):
@@ -11,6 +12,8 @@ class WorkSpaceApi(MpcBaseApi):
     Provides methods for querying supported chains, coins, and blockchain information.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new WorkSpaceApi instance.
@@ -20,6 +23,7 @@ class WorkSpaceApi(MpcBaseApi):
         """
         super().__init__(config)
 
+    @cached_response(ttl=60)
     def get_support_main_chain(self) -> Dict[str, Any]:
         """
         Gets supported main chains.
@@ -34,6 +38,7 @@ class WorkSpaceApi(MpcBaseApi):
         response = self.get("/api/mpc/wallet/open_coin", {})
         return self.validate_response(response)
 
+    @cached_response(ttl=60)
     def get_coin_details(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Gets MPC workspace coin details.
@@ -62,6 +67,7 @@ class WorkSpaceApi(MpcBaseApi):
         response = self.get("/api/mpc/coin_list", params)
         return self.validate_response(response)
 
+    @cached_response(ttl=5)
     def get_last_block_height(self, params: Dict[str, str]) -> Dict[str, Any]:
         """
         Gets last block height.
@@ -5,21 +5,22 @@ Uses Builder pattern for flexible configuration
 """
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from chainup_custody_sdk.mpc.mpc_config import MpcConfig
 from chainup_custody_sdk.logger import get_logger, LoggerMixin
+from chainup_custody_sdk.utils.http_client import BaseHttpClient
+from chainup_custody_sdk.mpc.api.wallet_api import WalletApi
+from chainup_custody_sdk.mpc.api.deposit_api import DepositApi
+from chainup_custody_sdk.mpc.api.withdraw_api import WithdrawApi
+from chainup_custody_sdk.mpc.api.web3_api import Web3Api
+from chainup_custody_sdk.mpc.api.auto_sweep_api import AutoSweepApi
+from chainup_custody_sdk.mpc.api.notify_api import NotifyApi
+from chainup_custody_sdk.mpc.api.workspace_api import WorkSpaceApi
+from chainup_custody_sdk.mpc.api.tron_resource_api import TronResourceApi
 
 if TYPE_CHECKING:
     from chainup_custody_sdk.utils.crypto_provider import ICryptoProvider
-    from chainup_custody_sdk.mpc.api.wallet_api import WalletApi
-    from chainup_custody_sdk.mpc.api.deposit_api import DepositApi
-    from chainup_custody_sdk.mpc.api.withdraw_api import WithdrawApi
-    from chainup_custody_sdk.mpc.api.web3_api import Web3Api
-    from chainup_custody_sdk.mpc.api.auto_sweep_api import AutoSweepApi
-    from chainup_custody_sdk.mpc.api.notify_api import NotifyApi
-    from chainup_custody_sdk.mpc.api.workspace_api import WorkSpaceApi
-    from chainup_custody_sdk.mpc.api.tron_resource_api import TronResourceApi
 
 
 class MpcClient(LoggerMixin):
@@ -44,7 +45,18 @@ class MpcClient(LoggerMixin):
             # ... use API
     """
     
-    __slots__ = ("config", "_closed")
+    __slots__ = (
+        "config",
+        "_closed",
+        "_wallet_api",
+        "_deposit_api",
+        "_withdraw_api",
+        "_web3_api",
+        "_auto_sweep_api",
+        "_notify_api",
+        "_workspace_api",
+        "_tron_resource_api",
+    )
 
     def __init__(self, config: MpcConfig) -> None:
         """
@@ -58,8 +70,9 @@ class MpcClient(LoggerMixin):
         """
         self.config = config
         self._closed = False
+        self._reset_apis()
         self.config.validate()
-        self._logger.debug(f"MpcClient initialized with app_id={config.app_id}")
+        self._logger.debug("MpcClient initialized with app_id=%s", config.app_id)
 
     def __enter__(self) -> "MpcClient":
         """Enter context manager."""
@@ -77,87 +90,109 @@ class MpcClient(LoggerMixin):
         """
         if not self._closed:
             self._closed = True
+            # Release the pooled connections shared by this client's APIs
+            BaseHttpClient.close_shared(self.config)
+            self._reset_apis()
             self._logger.debug("MpcClient closed")
 
-    def get_wallet_api(self) -> "WalletApi":
+    def _reset_apis(self) -> None:
+        """Drops the cached API instances."""
+        self._wallet_api: Optional[WalletApi] = None
+        self._deposit_api: Optional[DepositApi] = None
+        self._withdraw_api: Optional[WithdrawApi] = None
+        self._web3_api: Optional[Web3Api] = None
+        self._auto_sweep_api: Optional[AutoSweepApi] = None
+        self._notify_api: Optional[NotifyApi] = None
+        self._workspace_api: Optional[WorkSpaceApi] = None
+        self._tron_resource_api: Optional[TronResourceApi] = None
+
+    def get_wallet_api(self) -> WalletApi:
         """
         Gets WalletApi instance for wallet operations.
 
         Returns:
-            WalletApi instance
+            WalletApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.wallet_api import WalletApi
-        return WalletApi(self.config)
+        if self._wallet_api is None:
+            self._wallet_api = WalletApi(self.config)
+        return self._wallet_api
 
-    def get_deposit_api(self) -> "DepositApi":
+    def get_deposit_api(self) -> DepositApi:
         """
         Gets DepositApi instance for deposit operations.
 
         Returns:
-            DepositApi instance
+            DepositApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.deposit_api import DepositApi
-        return DepositApi(self.config)
+        if self._deposit_api is None:
+            self._deposit_api = DepositApi(self.config)
+        return self._deposit_api
 
-    def get_withdraw_api(self) -> "WithdrawApi":
+    def get_withdraw_api(self) -> WithdrawApi:
         """
         Gets WithdrawApi instance for withdrawal operations.
 
         Returns:
-            WithdrawApi instance
+            WithdrawApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.withdraw_api import WithdrawApi
-        return WithdrawApi(self.config)
+        if self._withdraw_api is None:
+            self._withdraw_api = WithdrawApi(self.config)
+        return self._withdraw_api
 
-    def get_web3_api(self) -> "Web3Api":
+    def get_web3_api(self) -> Web3Api:
         """
         Gets Web3Api instance for Web3 operations.
 
         Returns:
-            Web3Api instance
+            Web3Api instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.web3_api import Web3Api
-        return Web3Api(self.config)
+        if self._web3_api is None:
+            self._web3_api = Web3Api(self.config)
+        return self._web3_api
 
-    def get_auto_sweep_api(self) -> "AutoSweepApi":
+    def get_auto_sweep_api(self) -> AutoSweepApi:
         """
         Gets AutoSweepApi instance for auto-sweep operations.
 
         Returns:
-            AutoSweepApi instance
+            AutoSweepApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.auto_sweep_api import AutoSweepApi
-        return AutoSweepApi(self.config)
+        if self._auto_sweep_api is None:
+            self._auto_sweep_api = AutoSweepApi(self.config)
+        return self._auto_sweep_api
 
-    def get_notify_api(self) -> "NotifyApi":
+    def get_notify_api(self) -> NotifyApi:
         """
         Gets NotifyApi instance for notification operations.
 
         Returns:
-            NotifyApi instance
+            NotifyApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.notify_api import NotifyApi
-        return NotifyApi(self.config)
+        if self._notify_api is None:
+            self._notify_api = NotifyApi(self.config)
+        return self._notify_api
 
-    def get_workspace_api(self) -> "WorkSpaceApi":
+    def get_workspace_api(self) -> WorkSpaceApi:
         """
         Gets WorkSpaceApi instance for workspace operations.
 
         Returns:
-            WorkSpaceApi instance
+            WorkSpaceApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.workspace_api import WorkSpaceApi
-        return WorkSpaceApi(self.config)
+        if self._workspace_api is None:
+            self._workspace_api = WorkSpaceApi(self.config)
+        return self._workspace_api
 
-    def get_tron_resource_api(self) -> "TronResourceApi":
+    def get_tron_resource_api(self) -> TronResourceApi:
         """
         Gets TronResourceApi instance for TRON resource operations.
 
         Returns:
-            TronResourceApi instance
+            TronResourceApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.mpc.api.tron_resource_api import TronResourceApi
-        return TronResourceApi(self.config)
+        if self._tron_resource_api is None:
+            self._tron_resource_api = TronResourceApi(self.config)
+        return self._tron_resource_api
 
     @staticmethod
     def builder() -> "MpcClientBuilder":
@@ -311,6 +346,49 @@ class MpcClientBuilder:
         self._options["debug"] = debug
         return self
 
+    def set_cache_responses(self, cache_responses: bool) -> "MpcClientBuilder":
+        """
+        Enables or disables in-process caching of workspace reference endpoints
+        (supported chains, coin details, block height).
+
+        Args:
+            cache_responses: Cache flag (default: False)
+
+        Returns:
+            This builder instance for chaining
+        """
+        self._options["cache_responses"] = cache_responses
+        return self
+
+    def set_redis_client(self, redis_client: Any) -> "MpcClientBuilder":
+        """
+        Caches responses of workspace reference endpoints in Redis, shared by
+        every process using the same Redis and app ID. Redis errors fall back
+        to calling the API.
+
+        Args:
+            redis_client: redis.Redis (or compatible) client
+
+        Returns:
+            This builder instance for chaining
+        """
+        self._options["redis_client"] = redis_client
+        return self
+
+    def set_retry_total(self, retry_total: int) -> "MpcClientBuilder":
+        """
+        Sets how often a request is retried after a connection failure or a
+        503 response.
+
+        Args:
+            retry_total: Maximum number of retries (default: 0, retrying disabled)
+
+        Returns:
+            This builder instance for chaining
+        """
+        self._options["retry_total"] = retry_total
+        return self
+
     def build(self) -> MpcClient:
         """
         Builds and returns a configured MpcClient instance.
@@ -2,8 +2,8 @@
 MPC Configuration Class
 Stores configuration parameters for MPC (Multi-Party Computation) API client
 """
-from dataclasses import dataclass
-from typing import Optional, TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from chainup_custody_sdk.exceptions import ConfigError
 
@@ -28,6 +28,12 @@ class MpcConfig:
         api_key: API key for authentication
         crypto_provider: Custom crypto provider implementation
         debug: Enable debug mode
+        cache_responses: Cache responses of workspace reference endpoints for a short TTL
+        redis_client: redis.Redis client used to cache responses across processes
+            (enables caching; cache_responses alone caches in-process)
+        retry_total: Maximum retries of a request after a connection failure or
+            a 503 response (default 0: MPC withdrawals and transfers are not
+            idempotent, so they are never re-sent unless enabled)
     
     Example:
         config = MpcConfig(
@@ -46,6 +52,17 @@ class MpcConfig:
     api_key: str = ""
     crypto_provider: Optional["ICryptoProvider"] = None
     debug: bool = False
+    cache_responses: bool = False
+    redis_client: Optional[Any] = None
+    retry_total: int = 0
+    # Per-config state shared by every API instance (see BaseHttpClient.shared
+    # and ttl_cache.get_response_cache); it lives exactly as long as the config
+    _shared_http_clients: Dict[type, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _shared_response_cache: Optional[Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Post-initialization processing."""
@@ -108,5 +125,8 @@ class MpcConfig:
             sign_private_key=data.get("sign_private_key", ""),
             domain=data.get("domain", "https://openapi.chainup.com/"),
             api_key=data.get("api_key", ""),
-            debug=data.get("debug", False)
+            debug=data.get("debug", False),
+            cache_responses=data.get("cache_responses", False),
+            retry_total=data.get("retry_total", 0),
+            redis_client=data.get("redis_client")
         )
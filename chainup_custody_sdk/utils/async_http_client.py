@@ -0,0 +1,164 @@
+"""
+Async HTTP Client - Handles asynchronous HTTP communication with APIs
+"""
+import asyncio
+from types import TracebackType
+from typing import Dict, Any, Optional, Type, Union, TYPE_CHECKING
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from chainup_custody_sdk.mpc.mpc_config import MpcConfig
+    from chainup_custody_sdk.waas.waas_config import WaasConfig
+
+
+class AsyncBaseHttpClient:
+    """
+    Async Base HTTP Client Class.
+    Asynchronous counterpart of BaseHttpClient built on aiohttp, allowing a
+    single event loop to keep many requests in flight at once.
+
+    Requires the optional ``aiohttp`` dependency:
+        pip install "chainup-custody-sdk[async]"
+    """
+
+    # Maximum number of simultaneous connections in the pool
+    DEFAULT_CONNECTION_LIMIT = 64
+
+    def __init__(
+        self,
+        config: Union["WaasConfig", "MpcConfig"],
+        content_type: Optional[str] = "application/x-www-form-urlencoded",
+        limit: int = DEFAULT_CONNECTION_LIMIT,
+    ) -> None:
+        """
+        Creates a new async HTTP client instance.
+
+        Args:
+            config: Config object (WaasConfig or MpcConfig)
+            content_type: Content-Type header value
+            limit: Maximum number of simultaneous connections (default: 64)
+        """
+        if aiohttp is None:
+            raise ImportError(
+                f"{type(self).__name__} requires aiohttp. "
+                'Install it with: pip install "chainup-custody-sdk[async]"'
+            )
+        self.config = config
+        self.limit = limit
+        # Absolute URL per API path; the set of paths is small and fixed
+        self._url_cache: Dict[str, str] = {}
+        self.headers = {"Content-Type": content_type} if content_type else {}
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """
+        Gets the shared client session, creating it on first use.
+        The session must be created inside a running event loop.
+
+        Returns:
+            aiohttp ClientSession instance
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.limit),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], str]] = None,
+    ) -> str:
+        """
+        Executes an HTTP request asynchronously.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data (dict, or an already form-encoded string)
+
+        Returns:
+            Response body as string
+
+        Raises:
+            RuntimeError: If request fails
+        """
+        data = data or {}
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.config.get_url(path)
+
+        if self.config.debug:
+            print(f"[HTTP Request]: {method} {url}")
+            print(f"[HTTP Data]: {data}")
+
+        session = self._get_session()
+        try:
+            if method == "POST":
+                response = await session.post(url, data=data, headers=self.headers)
+            elif method == "GET":
+                response = await session.get(url, params=data, headers=self.headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            async with response:
+                text = await response.text()
+
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status}: {text}")
+
+            if self.config.debug:
+                print(f"[HTTP Response]: {text}")
+
+            return text
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RuntimeError(f"HTTP request failed: {str(e)}")
+
+    async def close(self) -> None:
+        """
+        Closes the underlying client session and releases pooled connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "AsyncBaseHttpClient":
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        """Exit async context manager."""
+        await self.close()
+
+
+class AsyncHttpClient(AsyncBaseHttpClient):
+    """
+    Async WaaS HTTP Client Class.
+    Handles asynchronous HTTP communication with the WaaS API.
+    """
+
+    def __init__(
+        self,
+        config: "WaasConfig",
+        limit: int = AsyncBaseHttpClient.DEFAULT_CONNECTION_LIMIT,
+    ) -> None:
+        """
+        Creates a new async WaaS HTTP client instance.
+
+        Args:
+            config: WaasConfig object
+            limit: Maximum number of simultaneous connections (default: 64)
+        """
+        super().__init__(config, "application/x-www-form-urlencoded", limit)
@@ -0,0 +1,164 @@
+"""
+Async MPC HTTP Client - Handles asynchronous HTTP communication with the MPC API
+"""
+import asyncio
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
+
+from chainup_custody_sdk.utils import json_util
+from chainup_custody_sdk.utils.async_http_client import AsyncBaseHttpClient, aiohttp
+from chainup_custody_sdk.utils.mpc_sign_util import MpcSignUtil
+
+if TYPE_CHECKING:
+    from chainup_custody_sdk.mpc.mpc_config import MpcConfig
+
+
+class AsyncMpcHttpClient(AsyncBaseHttpClient):
+    """
+    Async MPC HTTP Client Class.
+    Asynchronous counterpart of MpcHttpClient built on aiohttp, allowing a single
+    event loop to keep many MPC requests in flight at once.
+    Uses the same request format as MpcHttpClient (app_id + encrypted data).
+
+    Requires the optional ``aiohttp`` dependency:
+        pip install "chainup-custody-sdk[async]"
+    """
+
+    def __init__(
+        self,
+        config: "MpcConfig",
+        limit: int = AsyncBaseHttpClient.DEFAULT_CONNECTION_LIMIT,
+    ) -> None:
+        """
+        Creates a new async MPC HTTP client instance.
+
+        Args:
+            config: MpcConfig object
+            limit: Maximum number of simultaneous connections (default: 64)
+        """
+        super().__init__(config, None, limit)  # MPC doesn't set Content-Type in headers
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], str]] = None,
+    ) -> str:
+        """
+        Executes an HTTP request asynchronously.
+        Request format matches Java SDK: only app_id and data (encrypted) are sent.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: RSA encrypted request data
+
+        Returns:
+            Response body as string
+
+        Raises:
+            RuntimeError: If request fails
+        """
+        encrypted_data = data if isinstance(data, str) else ""
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.config.get_url(path)
+        params = {"app_id": self.config.app_id, "data": encrypted_data}
+
+        if self.config.debug:
+            print(f"[MPC HTTP Request]: {method} {url}")
+            print(
+                f"[MPC HTTP Params]: app_id={params['app_id']}, data={encrypted_data[:100]}..."
+            )
+
+        session = self._get_session()
+        try:
+            if method == "POST":
+                # Use form submission (application/x-www-form-urlencoded)
+                response = await session.post(url, data=params)
+            elif method == "GET":
+                response = await session.get(url, params=params)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            async with response:
+                text = await response.text()
+
+            if response.status != 200:
+                raise RuntimeError(f"MPC HTTP {response.status}: {text}")
+
+            if self.config.debug:
+                print(f"[MPC HTTP Response]: {text}")
+
+            return text
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise RuntimeError(f"MPC HTTP request failed: {str(e)}")
+
+    async def request_json(
+        self, method: str, path: str, encrypted_data: str
+    ) -> Dict[str, Any]:
+        """
+        Executes an HTTP request asynchronously and parses the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            encrypted_data: RSA encrypted request data
+
+        Returns:
+            Response data as dict
+
+        Raises:
+            RuntimeError: If request fails or the response is not valid JSON
+        """
+        text = await self.request(method, path, encrypted_data)
+        try:
+            response: Dict[str, Any] = json_util.loads(text)
+        except json_util.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse MPC response: {str(e)}")
+        return response
+
+    async def post_async(self, path: str, encrypted_data: str) -> Dict[str, Any]:
+        """
+        Executes a POST request asynchronously.
+
+        Args:
+            path: API path
+            encrypted_data: Encrypted request data
+
+        Returns:
+            Response data as dict
+        """
+        return await self.request_json("POST", path, encrypted_data)
+
+    async def get_async(self, path: str, encrypted_data: str) -> Dict[str, Any]:
+        """
+        Executes a GET request asynchronously.
+
+        Args:
+            path: API path
+            encrypted_data: Encrypted request data
+
+        Returns:
+            Response data as dict
+        """
+        return await self.request_json("GET", path, encrypted_data)
+
+    @staticmethod
+    async def sign_async(sign_data: str, sign_private_key: str) -> str:
+        """
+        Signs data in the default thread pool executor.
+        RSA signing is CPU-bound; running it off the event loop keeps other
+        in-flight requests progressing while the signature is computed.
+
+        Args:
+            sign_data: Data to sign (sorted parameters string)
+            sign_private_key: RSA private key (PEM format or Base64 encoded)
+
+        Returns:
+            Base64 encoded signature
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, MpcSignUtil.sign, sign_data, sign_private_key
+        )
@@ -3,12 +3,36 @@ Crypto Provider - Interface and implementations for encryption/decryption
 """
 from abc import ABC, abstractmethod
 import base64
+import functools
 import hashlib
-from typing import Optional
+from typing import Optional, Tuple
 from Crypto.PublicKey import RSA
 from Crypto.Cipher import PKCS1_v1_5
 from Crypto.Signature import pkcs1_15
-from Crypto.Hash import SHA256
+
+from chainup_custody_sdk.utils.rsa_backend import powmod
+
+
+class Sha256Digest:
+    """
+    Precomputed SHA-256 digest usable with pkcs1_15 sign/verify.
+
+    pkcs1_15 only needs the hash OID and the final digest, so the one-shot
+    hashlib digest is wrapped directly instead of building a Crypto.Hash
+    SHA256 object for every call.
+    """
+
+    __slots__ = ("_digest",)
+
+    # ASN.1 object identifier of SHA-256 (same as Crypto.Hash.SHA256.oid)
+    oid = "2.16.840.1.101.3.4.2.1"
+    digest_size = 32
+
+    def __init__(self, data: bytes):
+        self._digest = hashlib.sha256(data).digest()
+
+    def digest(self) -> bytes:
+        return self._digest
 
 
 class ICryptoProvider(ABC):
@@ -69,6 +93,38 @@ class ICryptoProvider(ABC):
         raise NotImplementedError("Verify method not implemented")
 
 
+@functools.lru_cache(maxsize=64)
+def _import_rsa_key(pem: str) -> RSA.RsaKey:
+    """
+    Parses a PEM key, memoized by key material.
+    Clients built repeatedly from the same keys skip the ASN.1 decode.
+
+    Args:
+        pem: RSA key in PEM format
+
+    Returns:
+        Parsed RSA key
+    """
+    return RSA.import_key(pem)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_rsa_private_key(pem: str) -> Tuple[RSA.RsaKey, Tuple[int, int, int, int, int]]:
+    """
+    Parses a PEM private key and precomputes its CRT parameters
+    (p, q, dP, dQ, qInv), memoized by key material.
+
+    Args:
+        pem: RSA private key in PEM format
+
+    Returns:
+        Tuple of (parsed key, CRT parameters)
+    """
+    key = _import_rsa_key(pem)
+    p, q, d = int(key.p), int(key.q), int(key.d)
+    return key, (p, q, d % (p - 1), d % (q - 1), pow(q, -1, p))
+
+
 class RsaCryptoProvider(ICryptoProvider):
     """
     Default RSA Crypto Provider.
@@ -103,6 +159,77 @@ class RsaCryptoProvider(ICryptoProvider):
         self.charset = charset
         self.sign_private_key = self._format_rsa_key(sign_private_key, "private") if sign_private_key else None
 
+        # Parsed keys and CRT parameters, loaded on first use
+        self._private_rsa_key: Optional[RSA.RsaKey] = None
+        self._public_rsa_key: Optional[RSA.RsaKey] = None
+        self._sign_rsa_key: Optional[RSA.RsaKey] = None
+        self._crt_params: Optional[Tuple[int, int, int, int, int]] = None
+
+    def _get_private_rsa_key(self) -> RSA.RsaKey:
+        """
+        Gets the parsed private key, importing it on first use.
+        Also precomputes the CRT parameters (p, q, dP, dQ, qInv).
+
+        Returns:
+            Parsed RSA private key
+        """
+        if self._private_rsa_key is None:
+            self._private_rsa_key, self._crt_params = _load_rsa_private_key(self.private_key)
+        return self._private_rsa_key
+
+    def _get_crt_params(self) -> Tuple[int, int, int, int, int]:
+        """
+        Gets the CRT parameters (p, q, dP, dQ, qInv) of the private key,
+        importing the key on first use.
+
+        Returns:
+            CRT parameters
+        """
+        if self._crt_params is None:
+            self._private_rsa_key, self._crt_params = _load_rsa_private_key(self.private_key)
+        return self._crt_params
+
+    def _get_public_rsa_key(self) -> RSA.RsaKey:
+        """
+        Gets the parsed public key, importing it on first use.
+
+        Returns:
+            Parsed RSA public key
+        """
+        if self._public_rsa_key is None:
+            self._public_rsa_key = _import_rsa_key(self.public_key)
+        return self._public_rsa_key
+
+    def _get_sign_rsa_key(self) -> RSA.RsaKey:
+        """
+        Gets the parsed signing key (sign_private_key, or private_key if not set).
+
+        Returns:
+            Parsed RSA private key used for signing
+        """
+        if self._sign_rsa_key is None:
+            if self.sign_private_key:
+                self._sign_rsa_key = _import_rsa_key(self.sign_private_key)
+            else:
+                self._sign_rsa_key = self._get_private_rsa_key()
+        return self._sign_rsa_key
+
+    def _private_key_op(self, value: int) -> int:
+        """
+        Raw RSA private-key operation (value^d mod n) using the Chinese
+        Remainder Theorem: two half-size exponentiations plus a recombination.
+
+        Args:
+            value: Integer representative of the padded block
+
+        Returns:
+            Result of the private-key operation
+        """
+        p, q, d_p, d_q, q_inv = self._get_crt_params()
+        s1 = powmod(value, d_p, p)
+        s2 = powmod(value, d_q, q)
+        return s2 + q * (((s1 - s2) * q_inv) % p)
+
     @staticmethod
     def _format_rsa_key(key: str, key_type: str) -> str:
         """
@@ -153,7 +280,7 @@ class RsaCryptoProvider(ICryptoProvider):
 
         try:
             data_bytes = data.encode("utf-8")
-            key = RSA.import_key(self.private_key)
+            key = self._get_private_rsa_key()
             key_size = key.size_in_bytes()
             
             # For RSA with PKCS#1 v1.5 padding, max data size is key_size - 11
@@ -173,9 +300,9 @@ class RsaCryptoProvider(ICryptoProvider):
                 padding_len = key_size - len(chunk) - 3
                 padded = b'\x00\x01' + (b'\xff' * padding_len) + b'\x00' + chunk
                 
-                # Raw RSA operation with private key: m^d mod n
+                # Raw RSA operation with private key: m^d mod n (via CRT)
                 padded_int = int.from_bytes(padded, byteorder='big')
-                encrypted_int = pow(padded_int, key.d, key.n)
+                encrypted_int = self._private_key_op(padded_int)
                 encrypted_bytes = encrypted_int.to_bytes(key_size, byteorder='big')
 
                 encrypted_chunks.append(encrypted_bytes)
@@ -209,13 +336,11 @@ class RsaCryptoProvider(ICryptoProvider):
             raise ValueError("Public key is not set")
 
         try:
-            # Convert URL-safe base64 back to standard base64
-            padding = len(encrypted_data) % 4
-            if padding:
-                encrypted_data += "=" * (4 - padding)
-
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data)
-            key = RSA.import_key(self.public_key)
+            # Restore the "=" padding stripped during encoding
+            encrypted_bytes = base64.urlsafe_b64decode(
+                encrypted_data.encode("ascii") + b"=" * (-len(encrypted_data) % 4)
+            )
+            key = self._get_public_rsa_key()
             
             # Get key size in bytes
             key_size = key.size_in_bytes()
@@ -234,7 +359,7 @@ class RsaCryptoProvider(ICryptoProvider):
                 # encrypted = m^d mod n (server encrypts with private key)
                 # decrypted = encrypted^e mod n (client decrypts with public key)
                 encrypted_int = int.from_bytes(chunk, byteorder='big')
-                decrypted_int = pow(encrypted_int, key.e, key.n)
+                decrypted_int = powmod(encrypted_int, key.e, key.n)
                 
                 # Convert back to bytes
                 decrypted_bytes = decrypted_int.to_bytes(key_size, byteorder='big')
@@ -293,8 +418,8 @@ class RsaCryptoProvider(ICryptoProvider):
             md5_hash = hashlib.md5(data.encode("utf-8")).hexdigest()
             
             # Step 2: Sign the MD5 hash with RSA-SHA256
-            key = RSA.import_key(signing_key)
-            hash_obj = SHA256.new(md5_hash.encode("utf-8"))
+            key = self._get_sign_rsa_key()
+            hash_obj = Sha256Digest(md5_hash.encode("utf-8"))
             signature = pkcs1_15.new(key).sign(hash_obj)
             
             # Step 3: Return Base64 encoded signature
@@ -317,8 +442,8 @@ class RsaCryptoProvider(ICryptoProvider):
             raise ValueError("Public key is not set")
 
         try:
-            key = RSA.import_key(self.public_key)
-            hash_obj = SHA256.new(data.encode("utf-8"))
+            key = self._get_public_rsa_key()
+            hash_obj = Sha256Digest(data.encode("utf-8"))
             signature_bytes = base64.b64decode(signature)
             pkcs1_15.new(key).verify(hash_obj, signature_bytes)
             return True
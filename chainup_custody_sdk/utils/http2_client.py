@@ -0,0 +1,119 @@
+"""
+HTTP/2 Client - Handles WaaS HTTP communication over HTTP/2
+"""
+from typing import Dict, Any, Optional, Union, TYPE_CHECKING
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
+
+from chainup_custody_sdk.utils.http_client import BaseHttpClient, _open_clients
+
+if TYPE_CHECKING:
+    from chainup_custody_sdk.waas.waas_config import WaasConfig
+
+
+class Http2Client(BaseHttpClient):
+    """
+    HTTP/2 WaaS HTTP Client Class.
+    Drop-in replacement for HttpClient built on httpx. Requests issued from
+    several threads are multiplexed over one connection instead of each
+    holding a pooled HTTP/1.1 connection.
+
+    Requires the optional ``httpx[http2]`` dependency:
+        pip install "chainup-custody-sdk[http2]"
+    """
+
+    # httpx.Client instead of the base class's requests.Session
+    session: Any
+
+    def __init__(
+        self,
+        config: "WaasConfig",
+        content_type: Optional[str] = "application/x-www-form-urlencoded",
+    ) -> None:
+        """
+        Creates a new HTTP/2 client instance.
+
+        Args:
+            config: WaasConfig object
+            content_type: Content-Type header value
+        """
+        if httpx is None:
+            raise ImportError(
+                "Http2Client requires httpx. "
+                'Install it with: pip install "chainup-custody-sdk[http2]"'
+            )
+        self.config = config
+        # Absolute URL per API path; the set of paths is small and fixed
+        self._url_cache: Dict[str, str] = {}
+        # Only connection failures are retried; httpx has no status retries
+        self.session = httpx.Client(
+            http2=True,
+            timeout=30,
+            headers={"Content-Type": content_type} if content_type else None,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=config.retry_total,
+                limits=httpx.Limits(
+                    max_connections=self.POOL_MAXSIZE,
+                    max_keepalive_connections=self.POOL_CONNECTIONS,
+                ),
+            ),
+        )
+        _open_clients.add(self)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Union[Dict[str, Any], str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Executes an HTTP request.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data (dict, or an already form-encoded string)
+            headers: Additional headers
+
+        Returns:
+            Response body as string
+
+        Raises:
+            RuntimeError: If request fails
+        """
+        data = data or {}
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.config.get_url(path)
+
+        if self.config.debug:
+            print(f"[HTTP Request]: {method} {url}")
+            print(f"[HTTP Data]: {data}")
+
+        try:
+            if method == "POST":
+                if isinstance(data, str):
+                    response = self.session.post(url, content=data, headers=headers)
+                else:
+                    response = self.session.post(url, data=data, headers=headers)
+            elif method == "GET":
+                response = self.session.get(url, params=data, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            text: str = response.text
+            if response.status_code != 200:
+                raise RuntimeError(f"HTTP {response.status_code}: {text}")
+
+            if self.config.debug:
+                print(f"[HTTP Response]: {text}")
+
+            return text
+
+        except httpx.HTTPError as e:
+            raise RuntimeError(f"HTTP request failed: {str(e)}")
@@ -1,9 +1,37 @@
 """
 HTTP Client - Handles HTTP communication with APIs
 """
+import atexit
 import json
-from typing import Dict, Any, Optional
+import threading
+import weakref
+from typing import Dict, Any, Optional, Type, TypeVar, Union, TYPE_CHECKING
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    from chainup_custody_sdk.mpc.mpc_config import MpcConfig
+    from chainup_custody_sdk.waas.waas_config import WaasConfig
+
+# Type of the client returned by BaseHttpClient.shared()
+_ClientT = TypeVar("_ClientT", bound="BaseHttpClient")
+
+# Guards creation of the per-config shared HTTP clients
+_shared_clients_lock = threading.Lock()
+
+# Clients still open, closed at interpreter shutdown without keeping them alive
+_open_clients: "weakref.WeakSet[BaseHttpClient]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_clients() -> None:
+    """Closes the pooled connections of every HTTP client still open at exit."""
+    for client in list(_open_clients):
+        try:
+            client.close()
+        except Exception:  # pragma: no cover - best effort during shutdown
+            pass
 
 
 class BaseHttpClient:
@@ -12,7 +40,18 @@ class BaseHttpClient:
     Provides common HTTP request functionality for both WaaS and MPC APIs.
     """
 
-    def __init__(self, config, content_type="application/x-www-form-urlencoded"):
+    # Connection pool settings for the underlying requests.Session
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 50
+    # Only statuses telling that the request was not processed are retried,
+    # so non-idempotent POSTs are never re-sent after reaching the server
+    RETRY_STATUSES = (503,)
+
+    def __init__(
+        self,
+        config: Union["WaasConfig", "MpcConfig"],
+        content_type: Optional[str] = "application/x-www-form-urlencoded",
+    ) -> None:
         """
         Creates a new HTTP client instance.
 
@@ -21,15 +60,108 @@ class BaseHttpClient:
             content_type: Content-Type header value
         """
         self.config = config
+        # Absolute URL per API path; the set of paths is small and fixed
+        self._url_cache: Dict[str, str] = {}
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=self._build_retry(config.retry_total),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         if content_type:
             self.session.headers.update({"Content-Type": content_type})
+        _open_clients.add(self)
+
+    @classmethod
+    def _build_retry(cls, total: int) -> Retry:
+        """
+        Builds the urllib3 retry policy mounted on the session.
+        Retries happen inside the adapter and re-send the already encrypted
+        body, so they skip re-serialization and re-encryption.
+
+        Args:
+            total: Maximum number of retries (0 disables retrying)
+
+        Returns:
+            Retry policy
+        """
+        methods = frozenset({"GET", "POST"})
+        try:
+            return Retry(
+                total=total,
+                connect=total,
+                read=0,
+                status=total,
+                status_forcelist=cls.RETRY_STATUSES,
+                allowed_methods=methods,
+                backoff_factor=0.3,
+                # The last response is returned and reported by request()
+                raise_on_status=False,
+            )
+        except TypeError:  # pragma: no cover - urllib3 < 1.26
+            return Retry(  # type: ignore[call-arg]
+                total=total,
+                connect=total,
+                read=0,
+                status=total,
+                status_forcelist=cls.RETRY_STATUSES,
+                method_whitelist=methods,
+                backoff_factor=0.3,
+                raise_on_status=False,
+            )
+
+    @classmethod
+    def shared(
+        cls: Type[_ClientT], config: Union["WaasConfig", "MpcConfig"]
+    ) -> _ClientT:
+        """
+        Gets the HTTP client shared by all API instances using the same config.
+        Sharing one session keeps connections alive across API classes, so
+        repeated calls skip the TCP and TLS handshakes.
+
+        Args:
+            config: Config object (WaasConfig or MpcConfig)
+
+        Returns:
+            Shared HTTP client instance
+        """
+        # Cached on the config itself so the client lives exactly as long as it
+        with _shared_clients_lock:
+            clients = config._shared_http_clients
+            client = clients.get(cls)
+            if client is None:
+                client = cls(config)
+                clients[cls] = client
+        return client
+
+    @staticmethod
+    def close_shared(config: Union["WaasConfig", "MpcConfig"]) -> None:
+        """
+        Closes every shared HTTP client created for a config.
+
+        Args:
+            config: Config object (WaasConfig or MpcConfig)
+        """
+        with _shared_clients_lock:
+            clients = list(config._shared_http_clients.values())
+            config._shared_http_clients.clear()
+        for client in clients:
+            client.close()
+
+    def close(self) -> None:
+        """
+        Closes the underlying session and its pooled connections.
+        """
+        _open_clients.discard(self)
+        self.session.close()
 
     def request(
         self,
         method: str,
         path: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], str]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> str:
         """
@@ -38,7 +170,7 @@ class BaseHttpClient:
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path
-            data: Request data
+            data: Request data (dict, or an already form-encoded string)
             headers: Additional headers
 
         Returns:
@@ -50,7 +182,9 @@ class BaseHttpClient:
         data = data or {}
         headers = headers or {}
 
-        url = self.config.get_url(path)
+        url = self._url_cache.get(path)
+        if url is None:
+            url = self._url_cache[path] = self.config.get_url(path)
 
         request_headers = {**self.session.headers, **headers}
 
@@ -116,7 +250,7 @@ class HttpClient(BaseHttpClient):
     Handles HTTP communication with the WaaS API.
     """
 
-    def __init__(self, config):
+    def __init__(self, config: "WaasConfig") -> None:
         """
         Creates a new WaaS HTTP client instance.
 
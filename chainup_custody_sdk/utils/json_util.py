@@ -0,0 +1,86 @@
+"""
+JSON Utility - JSON encoding/decoding with optional orjson acceleration
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. For the types the SDK sends (dict, list, str, int, float, bool,
+None and Decimal) both paths produce the same compact output with non-ASCII
+characters written as UTF-8 rather than ``\\uXXXX`` escapes, so request
+payloads do not depend on which backend is active. This differs from the
+plain ``json.dumps`` output used before, so the signed and encrypted bytes of
+bodies containing non-ASCII text change; the decoded JSON is the same.
+
+orjson additionally serializes datetime, UUID and dataclass instances
+natively, while the stdlib path raises TypeError for them; convert such
+values before passing them to the SDK.
+"""
+import json
+from decimal import Decimal
+from types import ModuleType
+from typing import Any, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError is a subclass of json.JSONDecodeError
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """
+    Serializes types neither backend handles natively.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON-serializable replacement
+
+    Raises:
+        TypeError: If the type is not supported
+    """
+    if isinstance(obj, Decimal):
+        # Amounts are sent as strings, which also keeps their exact precision
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serializes an object to a compact JSON string.
+    Decimal values (e.g. amounts) are serialized as strings.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string without whitespace between separators
+    """
+    if orjson is not None:
+        try:
+            encoded: bytes = orjson.dumps(obj, default=_default)
+            return encoded.decode("utf-8")
+        except TypeError:
+            # Types orjson rejects (e.g. non-str keys) go through the stdlib
+            pass
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON document.
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Parsed object
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,9 +1,9 @@
 """
 MPC HTTP Client - Handles HTTP communication with the MPC API
 """
-import json
 from typing import Dict, Any, Optional
 import requests
+from chainup_custody_sdk.utils import json_util
 from chainup_custody_sdk.utils.http_client import BaseHttpClient
 
 
@@ -76,11 +76,11 @@ class MpcHttpClient(BaseHttpClient):
                 print(f"[MPC HTTP Response]: {response.text}")
 
             # Parse JSON response
-            return response.json()
+            return json_util.loads(response.content)
 
         except requests.RequestException as e:
             raise RuntimeError(f"MPC HTTP request failed: {str(e)}")
-        except json.JSONDecodeError as e:
+        except json_util.JSONDecodeError as e:
             raise RuntimeError(f"Failed to parse MPC response: {str(e)}")
 
     def post(self, path: str, encrypted_data: str) -> Dict[str, Any]:
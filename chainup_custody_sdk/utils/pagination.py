@@ -0,0 +1,39 @@
+"""
+Pagination - Iteration over max_id-paginated sync endpoints
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List
+
+
+def iter_sync_records(
+    fetch: Callable[[int], List[Dict[str, Any]]], max_id: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields every record of a max_id-paginated sync endpoint.
+    As soon as a page arrives the request for the next one is submitted
+    to a single background worker, so it is in flight while the caller
+    processes the current page. At most two pages are held at a time.
+    Each page is requested with the highest ``id`` of the previous page as
+    max_id, so every record must carry an ``id`` field.
+
+    Args:
+        fetch: Sync method taking max_id and returning one page (a list)
+        max_id: ID to start syncing after
+
+    Yields:
+        Records in server order
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(fetch, max_id)
+        while True:
+            page = future.result()
+            if not page:
+                return
+            next_max_id = max(int(record["id"]) for record in page)
+            if next_max_id <= max_id:
+                # Guard against a server that keeps returning the same page
+                yield from page
+                return
+            max_id = next_max_id
+            future = pool.submit(fetch, max_id)
+            yield from page
@@ -0,0 +1,109 @@
+"""
+Redis Cache - Response cache shared across processes through Redis
+"""
+from typing import Any, Hashable
+
+from chainup_custody_sdk.logger import get_logger
+from chainup_custody_sdk.utils import json_util
+
+_logger = get_logger("redis_cache")
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Converts a cache key into a form whose repr is identical in every process
+    (frozenset iteration order depends on the per-process string hash seed).
+
+    Args:
+        value: Cache key built by cached_response
+
+    Returns:
+        Equivalent value with deterministic ordering
+    """
+    if isinstance(value, frozenset):
+        return sorted((_canonical(v) for v in value), key=repr)
+    if isinstance(value, tuple):
+        return tuple(_canonical(v) for v in value)
+    return value
+
+
+class RedisCache:
+    """
+    Response cache storing JSON-encoded values in Redis.
+
+    Drop-in replacement for TTLCache used by cached_response, so several
+    processes (or repeated runs) share cached reference data. Redis errors
+    are logged and treated as cache misses, so an unavailable Redis only
+    costs the upstream request.
+
+    Example:
+        import redis
+        cache = RedisCache(redis.Redis(), prefix="chainup:my-app-id:")
+    """
+
+    __slots__ = ("client", "prefix")
+
+    def __init__(self, client: Any, prefix: str = "chainup_custody_sdk:"):
+        """
+        Creates a new Redis-backed cache.
+
+        Args:
+            client: redis.Redis (or compatible) client
+            prefix: Prefix for every key written by this cache
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: Hashable) -> str:
+        """Builds the Redis key for a cache key."""
+        return self.prefix + repr(_canonical(key))
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on miss, Redis error or undecodable value
+
+        Returns:
+            Cached value, or default
+        """
+        try:
+            raw = self.client.get(self._key(key))
+            if raw is None:
+                return default
+            return json_util.loads(raw)
+        except ValueError as e:
+            # JSONDecodeError is a ValueError: a corrupt entry is a miss
+            _logger.warning("Redis value could not be decoded: %s", e)
+            return default
+        except Exception as e:
+            _logger.warning("Redis get failed: %s", e)
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Stores a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl: Time to live in seconds
+        """
+        try:
+            self.client.set(self._key(key), json_util.dumps(value), px=int(ttl * 1000))
+        except Exception as e:
+            _logger.warning("Redis set failed: %s", e)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes a value if present.
+
+        Args:
+            key: Cache key
+        """
+        try:
+            self.client.delete(self._key(key))
+        except Exception as e:
+            _logger.warning("Redis delete failed: %s", e)
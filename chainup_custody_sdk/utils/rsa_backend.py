@@ -0,0 +1,54 @@
+"""
+RSA Backend - Selects the modular exponentiation used for raw RSA operations
+
+The backend is chosen once at import time via the CHAINUP_RSA_BACKEND
+environment variable:
+    - "python" (default): built-in pow()
+    - "gmpy2": gmpy2.powmod() (GMP-backed, requires the optional gmpy2 package)
+"""
+import os
+from typing import Callable, Tuple
+
+from chainup_custody_sdk.logger import get_logger
+
+# Environment variable used to select the backend
+BACKEND_ENV_VAR = "CHAINUP_RSA_BACKEND"
+
+BACKEND_PYTHON = "python"
+BACKEND_GMPY2 = "gmpy2"
+
+
+def _load_backend() -> Tuple[str, Callable[[int, int, int], int]]:
+    """
+    Resolves the configured backend, falling back to built-in pow().
+
+    Returns:
+        Tuple of (backend name, powmod function)
+    """
+    requested = os.environ.get(BACKEND_ENV_VAR, "").strip().lower()
+    if not requested or requested == BACKEND_PYTHON:
+        return BACKEND_PYTHON, pow
+
+    logger = get_logger("rsa_backend")
+    if requested == BACKEND_GMPY2:
+        try:
+            import gmpy2
+        except ImportError:
+            logger.warning(
+                "%s=gmpy2 but gmpy2 is not installed, using built-in pow()",
+                BACKEND_ENV_VAR,
+            )
+            return BACKEND_PYTHON, pow
+
+        gmpy2_powmod = gmpy2.powmod
+
+        def _gmpy2_powmod(base: int, exp: int, mod: int) -> int:
+            return int(gmpy2_powmod(base, exp, mod))
+
+        return BACKEND_GMPY2, _gmpy2_powmod
+
+    logger.warning("Unknown %s=%r, using built-in pow()", BACKEND_ENV_VAR, requested)
+    return BACKEND_PYTHON, pow
+
+
+BACKEND_NAME, powmod = _load_backend()
@@ -0,0 +1,243 @@
+"""
+TTL Cache - Small in-process cache for idempotent read endpoints
+"""
+import copy
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Sentinel for cache misses (None is a valid cached value)
+_MISSING = object()
+
+# Guards creation of the per-config shared response caches
+_shared_cache_lock = threading.Lock()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire a fixed time after insertion.
+
+    Example:
+        cache = TTLCache(maxsize=512)
+        cache.set("coins", coin_list, ttl=60)
+        coins = cache.get("coins")
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 512,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Creates a new cache.
+
+        Args:
+            maxsize: Maximum number of entries (least recently used are evicted)
+            timer: Monotonic clock used for expiry
+        """
+        self.maxsize = maxsize
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Gets a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on miss or expiry
+
+        Returns:
+            Cached value, or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._timer():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Stores a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            self._data[key] = (self._timer() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Removes a value if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def get_shared_cache(config: Any) -> TTLCache:
+    """
+    Gets the response cache shared by all API instances using the same config.
+
+    Args:
+        config: Config object
+
+    Returns:
+        Shared TTLCache instance
+    """
+    # Cached on the config itself so the cache lives exactly as long as it
+    with _shared_cache_lock:
+        cache: Optional[TTLCache] = config._shared_response_cache
+        if cache is None:
+            cache = TTLCache()
+            # object.__setattr__ because WaasConfig is frozen
+            object.__setattr__(config, "_shared_response_cache", cache)
+    return cache
+
+
+def get_response_cache(config: Any) -> Optional[Any]:
+    """
+    Gets the response cache API instances should use for a config.
+
+    Args:
+        config: Config object with cache_responses and redis_client options
+
+    Returns:
+        A RedisCache when a Redis client is configured, the shared in-process
+        TTLCache when cache_responses is set, otherwise None (caching disabled)
+    """
+    if config.redis_client is not None:
+        with _shared_cache_lock:
+            cache = config._shared_response_cache
+            if cache is None:
+                from chainup_custody_sdk.utils.redis_cache import RedisCache
+
+                # Namespaced by app ID so tenants sharing one Redis never collide
+                cache = RedisCache(
+                    config.redis_client, prefix=f"chainup_custody_sdk:{config.app_id}:"
+                )
+                object.__setattr__(config, "_shared_response_cache", cache)
+        return cache
+    if config.cache_responses:
+        return get_shared_cache(config)
+    return None
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    Converts request params (dicts, lists) into a hashable cache key.
+
+    Args:
+        value: Params to convert
+
+    Returns:
+        Hashable representation of value
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    frozen: Hashable = value
+    return frozen
+
+
+def first_page_key(name: str) -> Callable[..., Optional[Hashable]]:
+    """
+    Builds a cache key function for ``sync_*`` paging methods that caches
+    only the first page (``max_id`` 0). Later pages are requested once while
+    iterating, so caching them would only fill the cache.
+
+    Args:
+        name: Cache key prefix, unique per method
+
+    Returns:
+        Key function for cached_response
+
+    Example:
+        @cached_response(ttl=5, key=first_page_key("sync_user_address_list"))
+        def sync_user_address_list(self, max_id=0):
+            ...
+    """
+
+    def key(max_id: int = 0) -> Optional[Hashable]:
+        return None if max_id else (name, 0)
+
+    return key
+
+
+def cached_response(
+    ttl: float, key: Optional[Callable[..., Optional[Hashable]]] = None
+) -> Callable:
+    """
+    Decorator caching the validated response of an idempotent API method.
+
+    The cache is taken from the instance's ``response_cache`` attribute (a
+    TTLCache or RedisCache); when it is None (caching disabled) the method is
+    called directly. Hits return a deep copy so callers cannot mutate the
+    cached value.
+
+    Args:
+        ttl: Time to live in seconds
+        key: Optional function mapping the call arguments (without self) to the
+            cache key, for entries other methods need to invalidate, or to None
+            to call the method uncached. Defaults to the method name plus all
+            arguments.
+
+    Example:
+        @cached_response(ttl=60)
+        def get_coin_list(self, params=None):
+            ...
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = self.response_cache
+            if cache is None:
+                return func(self, *args, **kwargs)
+
+            cache_key: Optional[Hashable]
+            if key is None:
+                cache_key = (func.__qualname__, freeze(args), freeze(kwargs))
+            else:
+                cache_key = key(*args, **kwargs)
+            if cache_key is None:
+                return func(self, *args, **kwargs)
+            try:
+                hash(cache_key)
+            except TypeError:
+                # Unhashable arguments (e.g. custom objects): do not cache
+                return func(self, *args, **kwargs)
+
+            value = cache.get(cache_key, _MISSING)
+            if value is _MISSING:
+                value = func(self, *args, **kwargs)
+                cache.set(cache_key, value, ttl)
+            return copy.deepcopy(value)
+
+        return wrapper
+
+    return decorator
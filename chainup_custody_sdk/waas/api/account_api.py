@@ -1,8 +1,16 @@
 """
 Account API - Account and balance management operations
 """
-from typing import Dict, Any, List
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
+from chainup_custody_sdk.utils.ttl_cache import cached_response, first_page_key
+
+if TYPE_CHECKING:
+    from typing import Any, Iterator
 
 
 class AccountApi(BaseApi):
@@ -11,6 +19,8 @@ class AccountApi(BaseApi):
     Provides methods for querying account balances and deposit addresses.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new AccountApi instance.
@@ -20,7 +30,7 @@ class AccountApi(BaseApi):
         """
         super().__init__(config)
 
-    def get_user_account(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def get_user_account(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets user account balance for a specific cryptocurrency.
 
@@ -39,9 +49,9 @@ class AccountApi(BaseApi):
             })
         """
         response = self.post("/account/getByUidAndSymbol", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def get_user_address(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def get_user_address(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets user deposit address for a specific cryptocurrency.
 
@@ -60,9 +70,10 @@ class AccountApi(BaseApi):
             })
         """
         response = self.post("/account/getDepositAddress", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def get_company_account(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_response(ttl=60)
+    def get_company_account(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets company (merchant) account balance for a specific cryptocurrency.
 
@@ -77,9 +88,10 @@ class AccountApi(BaseApi):
             account = account_api.get_company_account({'symbol': 'ETH'})
         """
         response = self.post("/account/getCompanyBySymbol", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def get_user_address_info(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_response(ttl=60)
+    def get_user_address_info(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets user address information by address.
 
@@ -94,9 +106,10 @@ class AccountApi(BaseApi):
             info = account_api.get_user_address_info({'address': '0x1234...'})
         """
         response = self.post("/account/getDepositAddressInfo", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def sync_user_address_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+    @cached_response(ttl=5, key=first_page_key("sync_user_address_list"))
+    def sync_user_address_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs user address list by max ID (pagination).
 
@@ -110,4 +123,24 @@ class AccountApi(BaseApi):
             addresses = account_api.sync_user_address_list(0)
         """
         response = self.post("/address/syncList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    def iter_user_address_list(self, start_max_id: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all user addresses after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            User addresses
+
+        Example:
+            for address in account_api.iter_user_address_list():
+                print(address['address'])
+        """
+        return iter_sync_records(self.sync_user_address_list, start_max_id)
@@ -1,9 +1,15 @@
 """
 Async Notify API - Asynchronous notification management
 """
-from typing import Dict, Any, Optional
-import json
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.utils import json_util
+
+if TYPE_CHECKING:
+    from typing import Any
 
 
 class AsyncNotifyApi(BaseApi):
@@ -12,6 +18,8 @@ class AsyncNotifyApi(BaseApi):
     Provides methods for decrypting and managing webhook notifications.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new AsyncNotifyApi instance.
@@ -21,7 +29,7 @@ class AsyncNotifyApi(BaseApi):
         """
         super().__init__(config)
 
-    def notify_request(self, cipher: str) -> Optional[Dict[str, Any]]:
+    def notify_request(self, cipher: str) -> dict[str, Any] | None:
         """
         Decrypts deposit and withdrawal notification parameters.
         Used to decrypt encrypted notification data received from WaaS callbacks.
@@ -54,7 +62,7 @@ class AsyncNotifyApi(BaseApi):
                 return None
 
             # Parse JSON to notification arguments
-            notify = json.loads(raw)
+            notify = json_util.loads(raw)
             if not notify:
                 print("[AsyncNotify] JSON decode returned null")
                 return None
@@ -64,7 +72,7 @@ class AsyncNotifyApi(BaseApi):
             print(f"[AsyncNotify] Failed to decrypt notification: {str(error)}")
             return None
 
-    def verify_request(self, cipher: str) -> Optional[Dict[str, Any]]:
+    def verify_request(self, cipher: str) -> dict[str, Any] | None:
         """
         Decrypts withdrawal secondary verification request parameters.
         Used to decrypt verification request data for withdrawal operations
@@ -98,7 +106,7 @@ class AsyncNotifyApi(BaseApi):
                 return None
 
             # Parse JSON to withdrawal arguments
-            withdraw = json.loads(raw)
+            withdraw = json_util.loads(raw)
             if not withdraw:
                 print("[AsyncNotify] VerifyRequest JSON decode returned null")
                 return None
@@ -108,7 +116,7 @@ class AsyncNotifyApi(BaseApi):
             print(f"[AsyncNotify] Failed to decrypt verify request: {str(error)}")
             return None
 
-    def verify_response(self, withdraw: Dict[str, Any]) -> Optional[str]:
+    def verify_response(self, withdraw: dict[str, Any]) -> str | None:
         """
         Encrypts the secondary verification withdrawal response data.
         Used to encrypt the response data when confirming or rejecting
@@ -132,7 +140,7 @@ class AsyncNotifyApi(BaseApi):
 
         try:
             # Convert to JSON string
-            withdraw_json = json.dumps(withdraw, separators=(",", ":"))
+            withdraw_json = json_util.dumps(withdraw)
 
             # Encrypt with private key
             raw = self.crypto_provider.encrypt_with_private_key(withdraw_json)
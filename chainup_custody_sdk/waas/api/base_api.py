@@ -3,15 +3,36 @@ Base API Class - Provides common functionality for all WaaS API implementations
 """
 from __future__ import annotations
 
-import json
+import asyncio
+import re
 import time
-from typing import Dict, Any, Optional, Union
+from typing import TYPE_CHECKING
+from urllib.parse import quote_plus
 
 from chainup_custody_sdk.utils.http_client import HttpClient
 from chainup_custody_sdk.utils.crypto_provider import RsaCryptoProvider
+from chainup_custody_sdk.utils import json_util
+from chainup_custody_sdk.utils.ttl_cache import get_response_cache
 from chainup_custody_sdk.exceptions import ApiError, CryptoError, NetworkError
 from chainup_custody_sdk.logger import LoggerMixin
 
+if TYPE_CHECKING:
+    from typing import Any, Awaitable, Callable, TypeVar
+
+    from chainup_custody_sdk.utils.async_http_client import AsyncHttpClient
+    from chainup_custody_sdk.utils.http_client import BaseHttpClient
+
+    T = TypeVar("T")
+
+# Plain {"code", "msg", "data": "<ciphertext>"} envelope. When a response matches
+# it, the ciphertext is sliced out directly instead of parsing the outer JSON.
+_ENVELOPE_FIELD = r'"(?:code|msg)"\s*:\s*(?:-?\d+|"[^"\\]*")'
+_ENCRYPTED_ENVELOPE_RE = re.compile(
+    r'\s*\{(?:\s*' + _ENVELOPE_FIELD + r'\s*,)*'
+    r'\s*"data"\s*:\s*"([A-Za-z0-9+/_=-]+)"'
+    r'(?:\s*,\s*' + _ENVELOPE_FIELD + r')*\s*\}\s*'
+)
+
 
 class BaseApi(LoggerMixin):
     """
@@ -23,7 +44,21 @@ class BaseApi(LoggerMixin):
     - Response: decrypt data field with public key
     """
     
-    __slots__ = ("config", "http_client", "crypto_provider")
+    __slots__ = (
+        "config",
+        "http_client",
+        "crypto_provider",
+        "response_cache",
+        "_charset",
+        "_empty_args_suffix",
+        "_form_prefix",
+        "_request_impl",
+        "_async_http_client",
+        "_http",
+        "_encrypt",
+        "_decrypt",
+        "_log",
+    )
 
     def __init__(self, config) -> None:
         """
@@ -33,7 +68,20 @@ class BaseApi(LoggerMixin):
             config: WaasConfig object
         """
         self.config = config
-        self.http_client = HttpClient(config)
+        self.http_client: BaseHttpClient
+        if config.http2:
+            from chainup_custody_sdk.utils.http2_client import Http2Client
+            self.http_client = Http2Client.shared(config)
+        else:
+            self.http_client = HttpClient.shared(config)
+        self._async_http_client: AsyncHttpClient | None = None
+        self.response_cache = get_response_cache(config)
+
+        # Static request args, computed once per instance
+        self._charset = config.charset or "utf-8"
+        self._empty_args_suffix = ',"charset":' + json_util.dumps(self._charset) + "}"
+        # Form-encoded request body up to the encrypted data value
+        self._form_prefix = "app_id=" + quote_plus(str(config.app_id)) + "&data="
 
         # Use custom crypto provider or create default RSA provider
         if config.crypto_provider:
@@ -45,28 +93,63 @@ class BaseApi(LoggerMixin):
                 charset=config.charset,
             )
 
-    def _build_request_args(self, data: Optional[Dict[str, Any]] = None) -> str:
+        # Hot-path callables, bound once instead of looked up per request
+        self._http = self.http_client.request
+        self._log = self._logger
+
+        # The provider never changes, so pick the request path once
+        if self.crypto_provider:
+            self._encrypt = self.crypto_provider.encrypt_with_private_key
+            self._decrypt = self.crypto_provider.decrypt_with_public_key
+            self._request_impl = self._execute_request_crypto
+        else:
+            self._encrypt = self._decrypt = None
+            self._request_impl = self._execute_request_plain
+
+    def _build_request_args(self, data: dict[str, Any] | str | None = None) -> str:
         """
         Builds the request args JSON with common parameters.
         Matches Java SDK: args.setCharset(), args.setTime(), args.toJson()
 
         Args:
-            data: API-specific request data
+            data: API-specific request data, or the same already serialized
+                as a JSON object
 
         Returns:
             JSON string of request args
+
+        Raises:
+            ValueError: If a serialized body is not a JSON object
         """
-        data = data or {}
-        args = {
-            **data,
-            "time": int(time.time() * 1000),  # Milliseconds timestamp
-            "charset": self.config.charset or "utf-8",
-        }
-        return json.dumps(args, separators=(",", ":"))
+        timestamp = int(time.time() * 1000)  # Milliseconds timestamp
+        if isinstance(data, str):
+            body = data.strip()
+            if not (body.startswith("{") and body.endswith("}")):
+                raise ValueError("Request body must be a serialized JSON object")
+            if '"time"' in body or '"charset"' in body:
+                # Parse so the common fields replace the body's own values
+                return self._build_request_args(json_util.loads(body))
+            head = body[:-1].rstrip()
+            if head == "{":
+                return '{"time":' + str(timestamp) + self._empty_args_suffix
+            return head + ',"time":' + str(timestamp) + self._empty_args_suffix
+
+        if not data:
+            # Only the timestamp changes, so skip building and serializing a dict
+            return '{"time":' + str(timestamp) + self._empty_args_suffix
+
+        if "time" in data or "charset" in data:
+            args = dict(data)
+            args["time"] = timestamp
+            args["charset"] = self._charset
+            return json_util.dumps(args)
+
+        # Splice the common fields onto the serialized params instead of copying the dict
+        return json_util.dumps(data)[:-1] + ',"time":' + str(timestamp) + self._empty_args_suffix
 
     def _execute_request(
-        self, method: str, path: str, data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        self, method: str, path: str, data: dict[str, Any] | str | None = None
+    ) -> dict[str, Any]:
         """
         Executes an API request with signing and encryption.
         
@@ -89,61 +172,233 @@ class BaseApi(LoggerMixin):
             NetworkError: If HTTP request fails
             ApiError: If API returns an error
         """
+        return self._request_impl(method, path, data)
+
+    def _execute_request_crypto(
+        self, method: str, path: str, data: dict[str, Any] | str | None = None
+    ) -> dict[str, Any]:
+        """
+        Request path used when a crypto provider is configured.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data
+
+        Returns:
+            API response (decrypted if encrypted)
+        """
         # Step 1: Build request args JSON (matches Java SDK args.toJson())
         raw_json = self._build_request_args(data)
 
-        self._logger.debug(f"Request args: {raw_json}")
+        self._log.debug("Request args: %s", raw_json)
 
         # Step 2: Encrypt with private key (matches Java SDK dataCrypto.encode(raw))
-        encrypted_data = ""
-        if self.crypto_provider:
-            try:
-                encrypted_data = self.crypto_provider.encrypt_with_private_key(raw_json)
-                self._logger.debug(f"Encrypted data: {encrypted_data[:100]}...")
-            except Exception as e:
-                raise CryptoError(f"Failed to encrypt request data: {str(e)}")
+        try:
+            encrypted_data = self._encrypt(raw_json)
+            self._log.debug("Encrypted data: %.100s...", encrypted_data)
+        except Exception as e:
+            raise CryptoError(f"Failed to encrypt request data: {str(e)}")
 
         # Step 3: Send request with only app_id and data
-        request_data = {"app_id": self.config.app_id, "data": encrypted_data}
+        response_text = self._send(method, path, encrypted_data)
 
-        try:
-            response_text = self.http_client.request(method, path, request_data)
-        except RuntimeError as e:
-            raise NetworkError(str(e))
+        # Step 4: Decrypt the data field if it is encrypted
+        return self._decode_response(response_text)
 
-        self._logger.debug(f"Response: {response_text}")
+    def _decode_response(self, response_text: str) -> dict[str, Any]:
+        """
+        Parses a response body and decrypts its data field.
+        Responses that are a plain encrypted envelope skip the outer JSON parse.
 
-        # Step 4: Parse response and decrypt data if needed
-        try:
-            parsed_response = json.loads(response_text)
-        except json.JSONDecodeError as e:
-            raise ApiError(f"Invalid JSON response: {response_text}")
+        Args:
+            response_text: Response body
+
+        Returns:
+            Decrypted response, or the parsed response if it is not encrypted
+        """
+        match = _ENCRYPTED_ENVELOPE_RE.fullmatch(response_text)
+        if match is not None:
+            try:
+                decrypted = self._decrypt(match.group(1))
+                self._log.debug("Decrypted: %s", decrypted)
+                return json_util.loads(decrypted)
+            except Exception:
+                # Take the regular path, which logs and handles the failure
+                pass
+
+        return self._decrypt_response(self._parse_response(response_text))
 
-        # Check if response has encrypted data field and decrypt
+    def _decrypt_response(self, parsed_response: dict[str, Any]) -> dict[str, Any]:
+        """
+        Decrypts the data field of a parsed response, if it is encrypted.
+
+        Args:
+            parsed_response: Parsed API response
+
+        Returns:
+            Decrypted response, or the response as-is if it is not encrypted
+        """
         if (
             parsed_response
             and "data" in parsed_response
             and isinstance(parsed_response["data"], str)
         ):
-            if self.crypto_provider:
-                try:
-                    decrypted = self.crypto_provider.decrypt_with_public_key(
-                        parsed_response["data"]
-                    )
-                    self._logger.debug(f"Decrypted: {decrypted}")
-                    # Parse decrypted JSON and return complete response
-                    decrypted_data = json.loads(decrypted)
-                    return decrypted_data
-                except Exception as e:
-                    self._logger.warning(f"Decrypt error: {str(e)}")
-                    # If decryption fails, might be an error response, return as-is
-                    return parsed_response
+            try:
+                decrypted = self._decrypt(parsed_response["data"])
+                self._log.debug("Decrypted: %s", decrypted)
+                # Parse decrypted JSON and return complete response
+                decrypted_data = json_util.loads(decrypted)
+                return decrypted_data
+            except Exception as e:
+                self._log.warning("Decrypt error: %s", e)
+                # If decryption fails, might be an error response, return as-is
+                return parsed_response
 
         return parsed_response
 
-    def post(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _execute_request_plain(
+        self, method: str, path: str, data: dict[str, Any] | str | None = None
+    ) -> dict[str, Any]:
         """
-        Executes a POST request.
+        Request path used when no crypto provider is configured.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data (unused, the request carries no payload)
+
+        Returns:
+            Parsed API response
+        """
+        # Without a provider there is no way to encode the args, send empty data
+        return self._parse_response(self._send(method, path, ""))
+
+    def _send(self, method: str, path: str, encrypted_data: str) -> str:
+        """
+        Sends the {app_id, data} form body.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            encrypted_data: Encrypted request payload
+
+        Returns:
+            Response body
+
+        Raises:
+            NetworkError: If HTTP request fails
+        """
+        # Pre-encoded form body
+        request_data = self._form_prefix + quote_plus(encrypted_data)
+
+        try:
+            response_text = self._http(method, path, request_data)
+        except RuntimeError as e:
+            raise NetworkError(str(e))
+
+        self._log.debug("Response: %s", response_text)
+        return response_text
+
+    def _parse_response(self, response_text: str) -> dict[str, Any]:
+        """
+        Parses the raw JSON response body.
+
+        Args:
+            response_text: Response body
+
+        Returns:
+            Parsed API response
+
+        Raises:
+            ApiError: If the response is not valid JSON
+        """
+        try:
+            return json_util.loads(response_text)
+        except json_util.JSONDecodeError as e:
+            raise ApiError(f"Invalid JSON response: {response_text}")
+
+    @property
+    def async_http_client(self) -> AsyncHttpClient:
+        """
+        Gets the async HTTP client, creating it on first use.
+        Requires the optional aiohttp dependency.
+
+        Returns:
+            AsyncHttpClient instance
+        """
+        if self._async_http_client is None:
+            from chainup_custody_sdk.utils.async_http_client import AsyncHttpClient
+            self._async_http_client = AsyncHttpClient(self.config)
+        return self._async_http_client
+
+    async def _execute_request_async(
+        self, method: str, path: str, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Executes an API request asynchronously.
+        RSA encryption and decryption are CPU-bound and run in the default
+        thread pool executor, so many requests can be in flight concurrently.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path
+            data: Request data
+
+        Returns:
+            API response (decrypted if encrypted)
+
+        Raises:
+            CryptoError: If encryption fails
+            NetworkError: If HTTP request fails
+            ApiError: If the response is not valid JSON
+        """
+        loop = asyncio.get_running_loop()
+        raw_json = self._build_request_args(data)
+
+        self._log.debug("Request args: %s", raw_json)
+
+        encrypted_data = ""
+        if self.crypto_provider:
+            try:
+                encrypted_data = await loop.run_in_executor(
+                    None, self._encrypt, raw_json
+                )
+            except Exception as e:
+                raise CryptoError(f"Failed to encrypt request data: {str(e)}")
+
+        request_data = self._form_prefix + quote_plus(encrypted_data)
+        try:
+            response_text = await self.async_http_client.request(method, path, request_data)
+        except RuntimeError as e:
+            raise NetworkError(str(e))
+
+        self._log.debug("Response: %s", response_text)
+
+        if not self.crypto_provider:
+            return self._parse_response(response_text)
+        return await loop.run_in_executor(None, self._decode_response, response_text)
+
+    async def post_async(
+        self, path: str, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Executes a POST request asynchronously.
+
+        Args:
+            path: API path
+            data: Request data
+
+        Returns:
+            API response
+        """
+        return await self._execute_request_async("POST", path, data)
+
+    async def get_async(
+        self, path: str, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        Executes a GET request asynchronously.
 
         Args:
             path: API path
@@ -152,27 +407,84 @@ class BaseApi(LoggerMixin):
         Returns:
             API response
         """
-        return self._execute_request("POST", path, data)
+        return await self._execute_request_async("GET", path, data)
+
+    async def close_async(self) -> None:
+        """
+        Closes the async HTTP client session, if one was opened.
+        """
+        if self._async_http_client is not None:
+            await self._async_http_client.close()
+
+    def _run_sync(self, awaitable: Awaitable[T]) -> T:
+        """
+        Runs an async API call to completion from synchronous code.
+        Must not be called from a running event loop.
+
+        Args:
+            awaitable: Coroutine using this API's async methods
+
+        Returns:
+            The coroutine's result
+        """
+
+        async def run() -> T:
+            try:
+                return await awaitable
+            finally:
+                # The session is bound to this event loop, which ends here
+                await self.close_async()
+
+        return asyncio.run(run())
+
+    def post(
+        self,
+        path: str,
+        data: dict[str, Any] | None = None,
+        *,
+        body: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Executes a POST request.
+
+        Args:
+            path: API path
+            data: Request data
+            body: Request data already serialized as a JSON object, used
+                instead of data to skip serialization
 
-    def get(self, path: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        Returns:
+            API response
+        """
+        return self._request_impl("POST", path, data if body is None else body)
+
+    def get(
+        self,
+        path: str,
+        data: dict[str, Any] | None = None,
+        *,
+        body: str | None = None,
+    ) -> dict[str, Any]:
         """
         Executes a GET request.
 
         Args:
             path: API path
             data: Request data
+            body: Request data already serialized as a JSON object, used
+                instead of data to skip serialization
 
         Returns:
             API response
         """
-        return self._execute_request("GET", path, data)
+        return self._request_impl("GET", path, data if body is None else body)
 
     def validate_response(self, response: Any) -> Any:
         """
         Validates response and handles errors.
 
         Args:
-            response: API response
+            response: API response (dict or raw JSON string)
 
         Returns:
             Validated response data
@@ -182,15 +494,31 @@ class BaseApi(LoggerMixin):
         """
         if isinstance(response, str):
             try:
-                response = json.loads(response)
-            except json.JSONDecodeError as e:
+                response = json_util.loads(response)
+            except json_util.JSONDecodeError as e:
                 raise ApiError(f"Invalid JSON response: {response}")
 
         if not isinstance(response, dict):
             return response
 
+        return self._validate_dict(response)
+
+    def _validate_dict(self, response: dict[str, Any]) -> Any:
+        """
+        Validates an already parsed response (as returned by _execute_request).
+
+        Args:
+            response: Parsed API response
+
+        Returns:
+            Validated response data
+
+        Raises:
+            ApiError: If response indicates an error
+        """
         code = response.get("code")
-        if code is not None and str(code) != "0":
+        # Decrypted responses usually carry an int code, so 0 short-circuits
+        if code is not None and code != 0 and code != "0":
             msg = response.get("msg", "Unknown error")
             raise ApiError(message=msg, code=int(code) if code else None)
 
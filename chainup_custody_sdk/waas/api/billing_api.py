@@ -1,8 +1,33 @@
 """
 Billing API - Deposit, withdrawal and miner fee operations
 """
-from typing import Dict, Any, List, Optional
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.utils.pagination import iter_sync_records
+from chainup_custody_sdk.utils.ttl_cache import cached_response, first_page_key
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
+
+
+def _join_ids(ids: list | str) -> str:
+    """
+    Formats record IDs as the comma-separated string the API expects.
+
+    Args:
+        ids: List of IDs (str or int), or an already joined string
+
+    Returns:
+        Comma-separated IDs
+    """
+    if isinstance(ids, str):
+        return ids
+    # map(str) also accepts int IDs, e.g. taken from sync results
+    return ",".join(map(str, ids))
 
 
 class BillingApi(BaseApi):
@@ -11,6 +36,8 @@ class BillingApi(BaseApi):
     Provides methods for withdraw requests and querying deposit/withdrawal records.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new BillingApi instance.
@@ -20,7 +47,7 @@ class BillingApi(BaseApi):
         """
         super().__init__(config)
 
-    def withdraw(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def withdraw(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Creates a withdrawal request.
 
@@ -45,9 +72,9 @@ class BillingApi(BaseApi):
             })
         """
         response = self.post("/billing/withdraw", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def withdraw_list(self, ids: list) -> List[Dict[str, Any]]:
+    def withdraw_list(self, ids: list) -> list[dict[str, Any]]:
         """
         Gets withdrawal records by request IDs.
 
@@ -60,10 +87,11 @@ class BillingApi(BaseApi):
         Example:
             withdrawals = billing_api.withdraw_list(['withdraw_001', 'withdraw_002'])
         """
-        response = self.post("/billing/withdrawList", {"ids": ",".join(ids)})
-        return self.validate_response(response)
+        response = self.post("/billing/withdrawList", {"ids": _join_ids(ids)})
+        return self._validate_dict(response)
 
-    def sync_withdraw_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+    @cached_response(ttl=5, key=first_page_key("sync_withdraw_list"))
+    def sync_withdraw_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs withdrawal records by max ID (pagination).
 
@@ -77,9 +105,9 @@ class BillingApi(BaseApi):
             withdrawals = billing_api.sync_withdraw_list(0)
         """
         response = self.post("/billing/syncWithdrawList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def deposit_list(self, ids: list) -> List[Dict[str, Any]]:
+    def deposit_list(self, ids: list) -> list[dict[str, Any]]:
         """
         Gets deposit records by WaaS IDs.
 
@@ -92,10 +120,11 @@ class BillingApi(BaseApi):
         Example:
             deposits = billing_api.deposit_list(['123', '456'])
         """
-        response = self.post("/billing/depositList", {"ids": ",".join(ids)})
-        return self.validate_response(response)
+        response = self.post("/billing/depositList", {"ids": _join_ids(ids)})
+        return self._validate_dict(response)
 
-    def sync_deposit_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+    @cached_response(ttl=5, key=first_page_key("sync_deposit_list"))
+    def sync_deposit_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs deposit records by max ID (pagination).
 
@@ -109,9 +138,9 @@ class BillingApi(BaseApi):
             deposits = billing_api.sync_deposit_list(0)
         """
         response = self.post("/billing/syncDepositList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def miner_fee_list(self, ids: list) -> List[Dict[str, Any]]:
+    def miner_fee_list(self, ids: list) -> list[dict[str, Any]]:
         """
         Gets miner fee records by WaaS IDs.
 
@@ -124,10 +153,11 @@ class BillingApi(BaseApi):
         Example:
             fees = billing_api.miner_fee_list(['123', '456'])
         """
-        response = self.post("/billing/minerFeeList", {"ids": ",".join(ids)})
-        return self.validate_response(response)
+        response = self.post("/billing/minerFeeList", {"ids": _join_ids(ids)})
+        return self._validate_dict(response)
 
-    def sync_miner_fee_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+    @cached_response(ttl=5, key=first_page_key("sync_miner_fee_list"))
+    def sync_miner_fee_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs miner fee records by max ID (pagination).
 
@@ -141,4 +171,187 @@ class BillingApi(BaseApi):
             fees = billing_api.sync_miner_fee_list(0)
         """
         response = self.post("/billing/syncMinerFeeList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    def iter_withdraw_list(self, start_max_id: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all withdrawal records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Withdrawal records
+
+        Example:
+            for withdrawal in billing_api.iter_withdraw_list():
+                print(withdrawal['request_id'])
+        """
+        return iter_sync_records(self.sync_withdraw_list, start_max_id)
+
+    def iter_deposit_list(self, start_max_id: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all deposit records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Deposit records
+
+        Example:
+            for deposit in billing_api.iter_deposit_list():
+                print(deposit['txid'])
+        """
+        return iter_sync_records(self.sync_deposit_list, start_max_id)
+
+    def iter_miner_fee_list(self, start_max_id: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all miner fee records after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Miner fee records
+
+        Example:
+            for fee in billing_api.iter_miner_fee_list():
+                print(fee['txid'])
+        """
+        return iter_sync_records(self.sync_miner_fee_list, start_max_id)
+
+    async def sync_all_withdrawals(self, max_id: int = 0) -> list[dict[str, Any]]:
+        """
+        Syncs all withdrawal records after max_id, following pagination.
+        Asynchronous, so several histories can be synced concurrently.
+
+        Args:
+            max_id: ID to start syncing after (default: 0, full history)
+
+        Returns:
+            All withdrawal records after max_id
+
+        Example:
+            withdrawals = await billing_api.sync_all_withdrawals()
+        """
+        return await self._sync_all_async("/billing/syncWithdrawList", max_id)
+
+    async def sync_all_deposits(self, max_id: int = 0) -> list[dict[str, Any]]:
+        """
+        Syncs all deposit records after max_id, following pagination.
+
+        Args:
+            max_id: ID to start syncing after (default: 0, full history)
+
+        Returns:
+            All deposit records after max_id
+
+        Example:
+            deposits = await billing_api.sync_all_deposits()
+        """
+        return await self._sync_all_async("/billing/syncDepositList", max_id)
+
+    async def sync_all_miner_fees(self, max_id: int = 0) -> list[dict[str, Any]]:
+        """
+        Syncs all miner fee records after max_id, following pagination.
+
+        Args:
+            max_id: ID to start syncing after (default: 0, full history)
+
+        Returns:
+            All miner fee records after max_id
+
+        Example:
+            fees = await billing_api.sync_all_miner_fees()
+        """
+        return await self._sync_all_async("/billing/syncMinerFeeList", max_id)
+
+    async def _sync_all_async(self, path: str, max_id: int) -> list[dict[str, Any]]:
+        """
+        Pages through a sync endpoint until it returns no more records.
+        Each page's max_id comes from the previous page, so pages are fetched
+        in order; concurrency comes from running several syncs at once.
+
+        Args:
+            path: Sync endpoint path
+            max_id: ID to start syncing after
+
+        Returns:
+            All records after max_id
+        """
+        records: list[dict[str, Any]] = []
+        while True:
+            response = await self.post_async(path, {"max_id": max_id})
+            page = self._validate_dict(response)
+            if not page:
+                return records
+            records.extend(page)
+            next_max_id = max(int(record["id"]) for record in page)
+            if next_max_id <= max_id:
+                # Guard against a server that keeps returning the same page
+                return records
+            max_id = next_max_id
+
+    def fetch_transaction_bundle(
+        self,
+        withdraw_ids: list | None = None,
+        deposit_ids: list | None = None,
+        fee_ids: list | None = None,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Gets withdrawal, deposit and miner fee records in one call.
+        The three queries are issued concurrently over the shared connection
+        pool, so the total latency is roughly that of the slowest query.
+
+        Args:
+            withdraw_ids: List of withdrawal request IDs
+            deposit_ids: List of WaaS deposit IDs
+            fee_ids: List of WaaS transaction IDs for miner fees
+
+        Returns:
+            Dict with 'withdraw', 'deposit' and 'miner_fee' record lists
+            (empty list for any ID list not provided)
+
+        Example:
+            bundle = billing_api.fetch_transaction_bundle(
+                withdraw_ids=['withdraw_001'],
+                deposit_ids=['123', '456'],
+                fee_ids=['123']
+            )
+            print(bundle['deposit'])
+        """
+        queries = {
+            "withdraw": (self.withdraw_list, withdraw_ids),
+            "deposit": (self.deposit_list, deposit_ids),
+            "miner_fee": (self.miner_fee_list, fee_ids),
+        }
+        result: dict[str, list[dict[str, Any]]] = {key: [] for key in queries}
+        pending: dict[str, tuple[Callable[[list], list[dict[str, Any]]], list]] = {}
+        for key, (method, ids) in queries.items():
+            if ids:
+                pending[key] = (method, ids)
+        if not pending:
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                key: executor.submit(method, ids)
+                for key, (method, ids) in pending.items()
+            }
+            for key, future in futures.items():
+                result[key] = future.result()
+
+        return result
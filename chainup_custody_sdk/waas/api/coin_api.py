@@ -1,8 +1,15 @@
 """
 Coin API - Cryptocurrency information operations
 """
-from typing import Dict, Any, List, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.utils.ttl_cache import cached_response
+
+if TYPE_CHECKING:
+    from typing import Any
 
 
 class CoinApi(BaseApi):
@@ -11,6 +18,8 @@ class CoinApi(BaseApi):
     Provides methods for querying supported cryptocurrencies.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new CoinApi instance.
@@ -20,7 +29,8 @@ class CoinApi(BaseApi):
         """
         super().__init__(config)
 
-    def get_coin_list(self, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    @cached_response(ttl=60)
+    def get_coin_list(self, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
         """
         Gets supported coin list.
         Retrieves information about all cryptocurrencies supported by the platform.
@@ -48,4 +58,4 @@ class CoinApi(BaseApi):
         """
         params = params or {}
         response = self.post("/user/getCoinList", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
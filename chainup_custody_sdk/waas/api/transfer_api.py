@@ -1,9 +1,18 @@
 """
 Transfer API - Internal account transfer operations
 """
-from typing import Dict, Any, List
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 from chainup_custody_sdk.waas.api.base_api import BaseApi
 
+if TYPE_CHECKING:
+    from typing import Any, Iterable, Iterator
+
 
 class TransferApi(BaseApi):
     """
@@ -11,10 +20,17 @@ class TransferApi(BaseApi):
     Provides methods for transferring funds between merchant accounts.
     """
 
+    __slots__ = ()
+
     # Query type constants
     REQUEST_ID = "request_id"
     RECEIPT = "receipt"
 
+    # IDs per transferList request in get_transfers
+    TRANSFER_IDS_CHUNK = 200
+    # Maximum number of transferList requests in flight in get_transfers
+    TRANSFER_QUERY_WORKERS = 4
+
     def __init__(self, config):
         """
         Creates a new TransferApi instance.
@@ -24,7 +40,7 @@ class TransferApi(BaseApi):
         """
         super().__init__(config)
 
-    def account_transfer(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def account_transfer(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Internal transfer between merchant accounts.
 
@@ -51,9 +67,76 @@ class TransferApi(BaseApi):
             })
         """
         response = self.post("/account/transfer", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    async def account_transfer_async(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Internal transfer between merchant accounts (asynchronous).
+        Same parameters and result as account_transfer().
+
+        Args:
+            params: Transfer parameters (see account_transfer)
 
-    def get_account_transfer_list(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        Returns:
+            Transfer result
+
+        Example:
+            result = await transfer_api.account_transfer_async({...})
+        """
+        response = await self.post_async("/account/transfer", params)
+        return self._validate_dict(response)
+
+    async def account_transfer_many(
+        self, params_list: list[dict[str, Any]], concurrency: int = 16
+    ) -> list[dict[str, Any]]:
+        """
+        Submits several internal transfers concurrently.
+        Each transfer carries its own request_id, so a batch that fails part
+        way can be resubmitted without duplicating completed transfers.
+
+        Args:
+            params_list: List of transfer parameters (see account_transfer)
+            concurrency: Maximum number of transfers in flight (default: 16)
+
+        Returns:
+            Transfer results, in the same order as params_list
+
+        Raises:
+            ApiError: The first error returned for any of the transfers
+
+        Example:
+            results = await transfer_api.account_transfer_many([
+                {'request_id': 'transfer_001', 'symbol': 'USDT', 'amount': '1',
+                 'from': '123', 'to': '456'},
+                {'request_id': 'transfer_002', 'symbol': 'USDT', 'amount': '2',
+                 'from': '123', 'to': '789'},
+            ])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def transfer(params: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self.account_transfer_async(params)
+
+        return list(await asyncio.gather(*(transfer(params) for params in params_list)))
+
+    def account_transfer_many_sync(
+        self, params_list: list[dict[str, Any]], concurrency: int = 16
+    ) -> list[dict[str, Any]]:
+        """
+        Blocking wrapper around account_transfer_many() for synchronous code.
+        Must not be called from a running event loop.
+
+        Args:
+            params_list: List of transfer parameters (see account_transfer)
+            concurrency: Maximum number of transfers in flight (default: 16)
+
+        Returns:
+            Transfer results, in the same order as params_list
+        """
+        return self._run_sync(self.account_transfer_many(params_list, concurrency))
+
+    def get_account_transfer_list(self, params: dict[str, Any]) -> list[dict[str, Any]]:
         """
         Gets transfer records by request IDs or receipts.
 
@@ -72,9 +155,61 @@ class TransferApi(BaseApi):
             })
         """
         response = self.post("/account/transferList", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    async def get_account_transfer_list_async(
+        self, params: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Gets transfer records by request IDs or receipts (asynchronous).
+
+        Args:
+            params: Query parameters (see get_account_transfer_list)
+
+        Returns:
+            Transfer records
+        """
+        response = await self.post_async("/account/transferList", params)
+        return self._validate_dict(response)
+
+    def get_transfers(
+        self,
+        ids: Iterable[str],
+        id_type: str = REQUEST_ID,
+        chunk: int = TRANSFER_IDS_CHUNK,
+    ) -> list[dict[str, Any]]:
+        """
+        Gets transfer records for any number of IDs.
+        IDs are sent in batches of ``chunk`` per request; when there is more
+        than one batch, up to four are queried concurrently.
 
-    def sync_account_transfer_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+        Args:
+            ids: Request IDs or receipts to query
+            id_type: Type of IDs: TransferApi.REQUEST_ID or TransferApi.RECEIPT
+            chunk: Maximum number of IDs per request (default: 200)
+
+        Returns:
+            Transfer records, batch by batch in the order of ids
+
+        Example:
+            transfers = transfer_api.get_transfers(['transfer_001', 'transfer_002'])
+        """
+        ids = list(ids)
+        batches = [
+            {"ids": ",".join(map(str, ids[i:i + chunk])), "ids_type": id_type}
+            for i in range(0, len(ids), chunk)
+        ]
+        if len(batches) <= 1:
+            return self.get_account_transfer_list(batches[0]) if batches else []
+
+        workers = min(self.TRANSFER_QUERY_WORKERS, len(batches))
+        results: list[dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for records in executor.map(self.get_account_transfer_list, batches):
+                results.extend(records)
+        return results
+
+    def sync_account_transfer_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs transfer records by max ID (pagination).
 
@@ -88,4 +223,41 @@ class TransferApi(BaseApi):
             transfers = transfer_api.sync_account_transfer_list(0)
         """
         response = self.post("/account/syncTransferList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    async def sync_account_transfer_list_async(
+        self, max_id: int = 0
+    ) -> list[dict[str, Any]]:
+        """
+        Syncs transfer records by max ID (asynchronous).
+
+        Args:
+            max_id: Maximum transaction ID for pagination
+
+        Returns:
+            Synced transfer records
+        """
+        response = await self.post_async("/account/syncTransferList", {"max_id": max_id})
+        return self._validate_dict(response)
+
+    def iter_account_transfer_list(
+        self, start_max_id: int = 0
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all transfer records after start_max_id, following
+        pagination. The next page is fetched in the background while the
+        current one is being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all records)
+
+        Yields:
+            Transfer records
+
+        Example:
+            for transfer in transfer_api.iter_account_transfer_list():
+                print(transfer['request_id'])
+        """
+        return iter_sync_records(self.sync_account_transfer_list, start_max_id)
@@ -1,8 +1,31 @@
 """
 User API - User management and registration operations
 """
-from typing import Dict, Any, List, Optional
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from chainup_custody_sdk.utils.pagination import iter_sync_records
 from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.utils.ttl_cache import cached_response
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterator
+
+
+def _mobile_user_key(params: dict[str, Any]) -> tuple | None:
+    """Cache key for user info looked up by mobile phone (None if incomplete)."""
+    if "country" not in params or "mobile" not in params:
+        return None
+    return ("user", "mobile", params["country"], params["mobile"])
+
+
+def _email_user_key(params: dict[str, Any]) -> tuple | None:
+    """Cache key for user info looked up by email (None if incomplete)."""
+    if "email" not in params:
+        return None
+    return ("user", "email", params["email"])
 
 
 class UserApi(BaseApi):
@@ -11,6 +34,8 @@ class UserApi(BaseApi):
     Provides methods for user registration, information retrieval, and coin list queries.
     """
 
+    __slots__ = ()
+
     def __init__(self, config):
         """
         Creates a new UserApi instance.
@@ -20,7 +45,7 @@ class UserApi(BaseApi):
         """
         super().__init__(config)
 
-    def register_mobile_user(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def register_mobile_user(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Registers a new user using mobile phone.
 
@@ -39,9 +64,11 @@ class UserApi(BaseApi):
             })
         """
         response = self.post("/user/createUser", params)
-        return self.validate_response(response)
+        result = self._validate_dict(response)
+        self._invalidate_user(_mobile_user_key, params)
+        return result
 
-    def register_email_user(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def register_email_user(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Registers a new user using email.
 
@@ -58,9 +85,26 @@ class UserApi(BaseApi):
             })
         """
         response = self.post("/user/registerEmail", params)
-        return self.validate_response(response)
+        result = self._validate_dict(response)
+        self._invalidate_user(_email_user_key, params)
+        return result
 
-    def get_mobile_user(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _invalidate_user(
+        self, key: Callable[[dict[str, Any]], tuple | None], params: dict[str, Any]
+    ) -> None:
+        """
+        Drops a cached user info lookup after the user changed.
+
+        Args:
+            key: Cache key function of the lookup
+            params: Parameters identifying the user
+        """
+        cache_key = key(params)
+        if self.response_cache is not None and cache_key is not None:
+            self.response_cache.pop(cache_key)
+
+    @cached_response(ttl=30, key=_mobile_user_key)
+    def get_mobile_user(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets user information by mobile phone.
 
@@ -79,9 +123,10 @@ class UserApi(BaseApi):
             })
         """
         response = self.post("/user/info", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def get_email_user(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    @cached_response(ttl=30, key=_email_user_key)
+    def get_email_user(self, params: dict[str, Any]) -> dict[str, Any]:
         """
         Gets user information by email.
 
@@ -98,9 +143,85 @@ class UserApi(BaseApi):
             })
         """
         response = self.post("/user/info", params)
-        return self.validate_response(response)
+        return self._validate_dict(response)
 
-    def sync_user_list(self, max_id: int = 0) -> List[Dict[str, Any]]:
+    async def get_mobile_user_async(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Gets user information by mobile phone (asynchronous).
+
+        Args:
+            params: Query parameters (see get_mobile_user)
+
+        Returns:
+            User information
+        """
+        response = await self.post_async("/user/info", params)
+        return self._validate_dict(response)
+
+    async def get_email_user_async(self, params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Gets user information by email (asynchronous).
+
+        Args:
+            params: Query parameters (see get_email_user)
+
+        Returns:
+            User information
+        """
+        response = await self.post_async("/user/info", params)
+        return self._validate_dict(response)
+
+    async def get_users_batch(
+        self, queries: list[dict[str, Any]], concurrency: int = 16
+    ) -> list[dict[str, Any]]:
+        """
+        Gets information for several users concurrently.
+        Queries with an 'email' key are looked up by email, all others by
+        country and mobile.
+
+        Args:
+            queries: List of query parameters (see get_mobile_user/get_email_user)
+            concurrency: Maximum number of lookups in flight (default: 16)
+
+        Returns:
+            User information, in the same order as queries
+
+        Raises:
+            ApiError: The first error returned for any of the lookups
+
+        Example:
+            users = await user_api.get_users_batch([
+                {'email': 'user@example.com'},
+                {'country': '86', 'mobile': '13800000000'},
+            ])
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def lookup(query: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                if "email" in query:
+                    return await self.get_email_user_async(query)
+                return await self.get_mobile_user_async(query)
+
+        return list(await asyncio.gather(*(lookup(query) for query in queries)))
+
+    def get_users_batch_sync(
+        self, queries: list[dict[str, Any]], concurrency: int = 16
+    ) -> list[dict[str, Any]]:
+        """
+        Blocking wrapper around get_users_batch() for synchronous code.
+        Must not be called from a running event loop.
+
+        Args:
+            queries: List of query parameters (see get_users_batch)
+            concurrency: Maximum number of lookups in flight (default: 16)
+
+        Returns:
+            User information, in the same order as queries
+        """
+        return self._run_sync(self.get_users_batch(queries, concurrency))
+
+    def sync_user_list(self, max_id: int = 0) -> list[dict[str, Any]]:
         """
         Syncs user list by max ID (pagination).
 
@@ -114,4 +235,37 @@ class UserApi(BaseApi):
             users = user_api.sync_user_list(0)
         """
         response = self.post("/user/syncList", {"max_id": max_id})
-        return self.validate_response(response)
+        return self._validate_dict(response)
+
+    async def sync_user_list_async(self, max_id: int = 0) -> list[dict[str, Any]]:
+        """
+        Syncs user list by max ID (asynchronous).
+
+        Args:
+            max_id: Maximum user ID for pagination (0 for first sync)
+
+        Returns:
+            Synced user list
+        """
+        response = await self.post_async("/user/syncList", {"max_id": max_id})
+        return self._validate_dict(response)
+
+    def iter_user_list(self, start_max_id: int = 0) -> Iterator[dict[str, Any]]:
+        """
+        Iterates over all users after start_max_id, following pagination.
+        The next page is fetched in the background while the current one is
+        being consumed.
+        Pages are requested after the highest ``id`` seen, so every record
+        must carry an ``id`` field.
+
+        Args:
+            start_max_id: ID to start syncing after (default: 0, all users)
+
+        Yields:
+            User records
+
+        Example:
+            for user in user_api.iter_user_list():
+                print(user['id'])
+        """
+        return iter_sync_records(self.sync_user_list, start_max_id)
@@ -5,19 +5,24 @@ Uses Builder pattern for flexible configuration
 """
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 from chainup_custody_sdk.waas.waas_config import WaasConfig
 from chainup_custody_sdk.logger import get_logger, LoggerMixin
+from chainup_custody_sdk.utils.http_client import BaseHttpClient
+from chainup_custody_sdk.waas.api.user_api import UserApi
+from chainup_custody_sdk.waas.api.account_api import AccountApi
+from chainup_custody_sdk.waas.api.billing_api import BillingApi
+from chainup_custody_sdk.waas.api.coin_api import CoinApi
+from chainup_custody_sdk.waas.api.transfer_api import TransferApi
+from chainup_custody_sdk.waas.api.async_notify_api import AsyncNotifyApi
 
 if TYPE_CHECKING:
     from chainup_custody_sdk.utils.crypto_provider import ICryptoProvider
-    from chainup_custody_sdk.waas.api.user_api import UserApi
-    from chainup_custody_sdk.waas.api.account_api import AccountApi
-    from chainup_custody_sdk.waas.api.billing_api import BillingApi
-    from chainup_custody_sdk.waas.api.coin_api import CoinApi
-    from chainup_custody_sdk.waas.api.transfer_api import TransferApi
-    from chainup_custody_sdk.waas.api.async_notify_api import AsyncNotifyApi
+
+
+# Marks builder options that were never set
+_UNSET = object()
 
 
 class WaasClient(LoggerMixin):
@@ -43,7 +48,16 @@ class WaasClient(LoggerMixin):
             # ... use API
     """
     
-    __slots__ = ("config", "_closed")
+    __slots__ = (
+        "config",
+        "_closed",
+        "_user_api",
+        "_account_api",
+        "_billing_api",
+        "_coin_api",
+        "_transfer_api",
+        "_async_notify_api",
+    )
 
     def __init__(self, config: WaasConfig) -> None:
         """
@@ -57,8 +71,9 @@ class WaasClient(LoggerMixin):
         """
         self.config = config
         self._closed = False
+        self._reset_apis()
         self.config.validate()
-        self._logger.debug(f"WaasClient initialized with app_id={config.app_id}")
+        self._logger.debug("WaasClient initialized with app_id=%s", config.app_id)
 
     def __enter__(self) -> "WaasClient":
         """Enter context manager."""
@@ -76,67 +91,85 @@ class WaasClient(LoggerMixin):
         """
         if not self._closed:
             self._closed = True
+            # Release the pooled connections shared by this client's APIs
+            BaseHttpClient.close_shared(self.config)
+            self._reset_apis()
             self._logger.debug("WaasClient closed")
 
-    def get_user_api(self) -> "UserApi":
+    def _reset_apis(self) -> None:
+        """Drops the cached API instances."""
+        self._user_api: Optional[UserApi] = None
+        self._account_api: Optional[AccountApi] = None
+        self._billing_api: Optional[BillingApi] = None
+        self._coin_api: Optional[CoinApi] = None
+        self._transfer_api: Optional[TransferApi] = None
+        self._async_notify_api: Optional[AsyncNotifyApi] = None
+
+    def get_user_api(self) -> UserApi:
         """
         Gets UserApi instance for user-related operations.
 
         Returns:
-            UserApi instance
+            UserApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.user_api import UserApi
-        return UserApi(self.config)
+        if self._user_api is None:
+            self._user_api = UserApi(self.config)
+        return self._user_api
 
-    def get_account_api(self) -> "AccountApi":
+    def get_account_api(self) -> AccountApi:
         """
         Gets AccountApi instance for account-related operations.
 
         Returns:
-            AccountApi instance
+            AccountApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.account_api import AccountApi
-        return AccountApi(self.config)
+        if self._account_api is None:
+            self._account_api = AccountApi(self.config)
+        return self._account_api
 
-    def get_billing_api(self) -> "BillingApi":
+    def get_billing_api(self) -> BillingApi:
         """
         Gets BillingApi instance for billing and transaction operations.
 
         Returns:
-            BillingApi instance
+            BillingApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.billing_api import BillingApi
-        return BillingApi(self.config)
+        if self._billing_api is None:
+            self._billing_api = BillingApi(self.config)
+        return self._billing_api
 
-    def get_coin_api(self) -> "CoinApi":
+    def get_coin_api(self) -> CoinApi:
         """
         Gets CoinApi instance for coin and blockchain operations.
 
         Returns:
-            CoinApi instance
+            CoinApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.coin_api import CoinApi
-        return CoinApi(self.config)
+        if self._coin_api is None:
+            self._coin_api = CoinApi(self.config)
+        return self._coin_api
 
-    def get_transfer_api(self) -> "TransferApi":
+    def get_transfer_api(self) -> TransferApi:
         """
         Gets TransferApi instance for transfer operations.
 
         Returns:
-            TransferApi instance
+            TransferApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.transfer_api import TransferApi
-        return TransferApi(self.config)
+        if self._transfer_api is None:
+            self._transfer_api = TransferApi(self.config)
+        return self._transfer_api
 
-    def get_async_notify_api(self) -> "AsyncNotifyApi":
+    def get_async_notify_api(self) -> AsyncNotifyApi:
         """
         Gets AsyncNotifyApi instance for async notification operations.
 
         Returns:
-            AsyncNotifyApi instance
+            AsyncNotifyApi instance (created on first use and reused)
         """
-        from chainup_custody_sdk.waas.api.async_notify_api import AsyncNotifyApi
-        return AsyncNotifyApi(self.config)
+        if self._async_notify_api is None:
+            self._async_notify_api = AsyncNotifyApi(self.config)
+        return self._async_notify_api
 
     @staticmethod
     def builder() -> "WaasClientBuilder":
@@ -180,11 +213,26 @@ class WaasClientBuilder:
         )
     """
     
-    __slots__ = ("_options",)
+    __slots__ = (
+        "host",
+        "app_id",
+        "private_key",
+        "public_key",
+        "crypto_provider",
+        "version",
+        "charset",
+        "debug",
+        "cache_responses",
+        "http2",
+        "retry_total",
+        "redis_client",
+    )
 
     def __init__(self) -> None:
         """Creates a new Builder instance."""
-        self._options: dict = {}
+        # Unset options fall back to the WaasConfig defaults
+        for name in self.__slots__:
+            setattr(self, name, _UNSET)
 
     def set_host(self, host: str) -> "WaasClientBuilder":
         """
@@ -196,7 +244,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["host"] = host
+        self.host = host
         return self
 
     def set_app_id(self, app_id: str) -> "WaasClientBuilder":
@@ -209,7 +257,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["app_id"] = app_id
+        self.app_id = app_id
         return self
 
     def set_private_key(self, private_key: str) -> "WaasClientBuilder":
@@ -222,7 +270,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["private_key"] = private_key
+        self.private_key = private_key
         return self
 
     def set_public_key(self, public_key: str) -> "WaasClientBuilder":
@@ -235,7 +283,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["public_key"] = public_key
+        self.public_key = public_key
         return self
 
     def set_crypto_provider(self, crypto_provider: "ICryptoProvider") -> "WaasClientBuilder":
@@ -248,7 +296,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["crypto_provider"] = crypto_provider
+        self.crypto_provider = crypto_provider
         return self
 
     def set_version(self, version: str) -> "WaasClientBuilder":
@@ -261,7 +309,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["version"] = version
+        self.version = version
         return self
 
     def set_charset(self, charset: str) -> "WaasClientBuilder":
@@ -274,7 +322,7 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["charset"] = charset
+        self.charset = charset
         return self
 
     def set_debug(self, debug: bool) -> "WaasClientBuilder":
@@ -287,7 +335,63 @@ class WaasClientBuilder:
         Returns:
             This builder instance for chaining
         """
-        self._options["debug"] = debug
+        self.debug = debug
+        return self
+
+    def set_cache_responses(self, cache_responses: bool) -> "WaasClientBuilder":
+        """
+        Enables or disables short-TTL caching of idempotent read endpoints
+        (coin list, company account, address info, first sync pages).
+
+        Args:
+            cache_responses: Cache flag (default: False)
+
+        Returns:
+            This builder instance for chaining
+        """
+        self.cache_responses = cache_responses
+        return self
+
+    def set_redis_client(self, redis_client: Any) -> "WaasClientBuilder":
+        """
+        Caches responses of idempotent read endpoints in Redis, shared by
+        every process using the same Redis and app ID. Redis errors fall back
+        to calling the API.
+
+        Args:
+            redis_client: redis.Redis (or compatible) client
+
+        Returns:
+            This builder instance for chaining
+        """
+        self.redis_client = redis_client
+        return self
+
+    def set_http2(self, http2: bool) -> "WaasClientBuilder":
+        """
+        Enables or disables HTTP/2 (requires the optional httpx[http2] package).
+
+        Args:
+            http2: HTTP/2 flag (default: False)
+
+        Returns:
+            This builder instance for chaining
+        """
+        self.http2 = http2
+        return self
+
+    def set_retry_total(self, retry_total: int) -> "WaasClientBuilder":
+        """
+        Sets how often a request is retried after a connection failure or a
+        503 response.
+
+        Args:
+            retry_total: Maximum number of retries (default: 2, 0 disables retrying)
+
+        Returns:
+            This builder instance for chaining
+        """
+        self.retry_total = retry_total
         return self
 
     def build(self) -> WaasClient:
@@ -300,5 +404,10 @@ class WaasClientBuilder:
         Raises:
             ConfigError: If required configuration is missing
         """
-        config = WaasConfig(**self._options)
+        options = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is not _UNSET:
+                options[name] = value
+        config = WaasConfig(**options)
         return WaasClient(config)
@@ -3,7 +3,7 @@ WaaS Configuration Class
 Stores configuration parameters for WaaS (Wallet-as-a-Service) API client
 """
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from chainup_custody_sdk.exceptions import ConfigError
 
@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from chainup_custody_sdk.utils.crypto_provider import ICryptoProvider
 
 
-@dataclass
+@dataclass(frozen=True)
 class WaasConfig:
     """
     WaaS Configuration Class.
@@ -28,6 +28,12 @@ class WaasConfig:
         version: API version
         charset: Request charset encoding
         debug: Enable debug mode
+        cache_responses: Cache responses of idempotent read endpoints for a short TTL
+        http2: Send requests over HTTP/2 (requires the optional httpx[http2] package)
+        retry_total: Maximum retries of a request after a connection failure or
+            a 503 response (0 disables retrying)
+        redis_client: redis.Redis client used to cache responses across processes
+            (enables caching; cache_responses alone caches in-process)
     
     Example:
         config = WaasConfig(
@@ -46,16 +52,35 @@ class WaasConfig:
     version: str = "v2"
     charset: str = "UTF-8"
     debug: bool = False
+    cache_responses: bool = False
+    http2: bool = False
+    retry_total: int = 2
+    redis_client: Optional[Any] = None
+    # host + version prefix shared by every request URL
+    _base_url: str = field(init=False, repr=False, compare=False)
+    # Set once validate() has succeeded; the config is immutable
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
+    # Per-config state shared by every API instance (see BaseHttpClient.shared
+    # and ttl_cache.get_response_cache); it lives exactly as long as the config
+    _shared_http_clients: Dict[type, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _shared_response_cache: Optional[Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def __post_init__(self) -> None:
         """Post-initialization processing."""
         # Normalize host URL
         if self.host and not self.host.endswith("/"):
             object.__setattr__(self, "host", self.host + "/")
+        object.__setattr__(self, "_base_url", f"{self.host}{self.version}/")
     
     def validate(self) -> bool:
         """
         Validates the configuration.
+        The config is immutable, so a successful result is remembered and
+        later calls (e.g. several clients sharing one config) return at once.
         
         Returns:
             True if configuration is valid
@@ -63,6 +88,8 @@ class WaasConfig:
         Raises:
             ConfigError: If required fields are missing or invalid
         """
+        if self._validated:
+            return True
         if not self.host:
             raise ConfigError("WaasConfig: host is required")
         if not self.app_id:
@@ -79,6 +106,7 @@ class WaasConfig:
                     "WaasConfig: public_key is required (or provide crypto_provider)"
                 )
         
+        object.__setattr__(self, "_validated", True)
         return True
     
     def get_url(self, path: str) -> str:
@@ -92,8 +120,7 @@ class WaasConfig:
             Full API URL
         """
         # Remove leading slash if present
-        path = path.lstrip("/")
-        return f"{self.host}{self.version}/{path}"
+        return self._base_url + (path[1:] if path.startswith("/") else path)
     
     @classmethod
     def from_dict(cls, data: dict) -> "WaasConfig":
@@ -113,5 +140,9 @@ class WaasConfig:
             host=data.get("host", "https://openapi.chainup.com/"),
             version=data.get("version", "v2"),
             charset=data.get("charset", "UTF-8"),
-            debug=data.get("debug", False)
+            debug=data.get("debug", False),
+            cache_responses=data.get("cache_responses", False),
+            http2=data.get("http2", False),
+            retry_total=data.get("retry_total", 2),
+            redis_client=data.get("redis_client")
         )
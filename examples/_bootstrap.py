@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+示例公共启动代码：允许在不安装的情况下运行示例，并检查依赖
+"""
+import os
+import sys
+
+# 示例用的加密数据样本
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def ensure_sdk(requirements="pycryptodome requests"):
+    """
+    将项目根目录加入 Python 路径并检查 SDK 是否可以导入，
+    缺少依赖时打印安装提示并退出
+
+    Args:
+        requirements: 提示安装的依赖包（空格分隔）
+    """
+    # 添加项目根目录到 Python 路径（允许在不安装的情况下运行）
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    # 检查依赖
+    try:
+        import chainup_custody_sdk  # noqa: F401
+    except ImportError as e:
+        print("=" * 60)
+        print("❌ 缺少必要的依赖")
+        print("=" * 60)
+        print(f"\n错误: {e}\n")
+        print("请先安装依赖:")
+        print(f"  pip3 install {requirements}")
+        print("\n或者:")
+        print("  pip3 install -r requirements.txt")
+        print("=" * 60)
+        sys.exit(1)
+
+
+def load_fixture(name):
+    """
+    读取 fixtures 目录下的样本数据（如加密的通知内容）
+
+    Args:
+        name: 文件名
+
+    Returns:
+        str: 去除首尾空白的文件内容
+    """
+    with open(os.path.join(FIXTURES_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read().strip()
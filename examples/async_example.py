@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+并发请求示例
+
+waas_example.py / mpc_example.py 中互不依赖的调用可以并发执行，
+总耗时约等于最慢的一个请求，而不是所有请求之和。
+需要安装 aiohttp: pip3 install "chainup-custody-sdk[async]"
+"""
+import asyncio
+from _bootstrap import ensure_sdk
+
+ensure_sdk("pycryptodome requests aiohttp")
+
+from chainup_custody_sdk import WaasClient, MpcClient, ApiError  # noqa: E402
+
+
+def show(name, result):
+    """打印单个并发调用的结果（失败时为异常）"""
+    if isinstance(result, Exception):
+        print(f"{name} 失败: {result}")
+    else:
+        print(f"{name}: {result}")
+
+
+async def waas_main():
+    # 创建 WaaS 客户端
+    client = (
+        WaasClient.new_builder()
+        .set_app_id("")
+        .set_private_key("")
+        .set_public_key("")
+        .build()
+    )
+    user_api = client.get_user_api()
+    transfer_api = client.get_transfer_api()
+    billing_api = client.get_billing_api()
+
+    try:
+        # 以下查询互不依赖，同时发出
+        results = await asyncio.gather(
+            user_api.get_email_user_async({"email": "user12@example.com"}),
+            user_api.sync_user_list_async(0),
+            transfer_api.sync_account_transfer_list_async(0),
+            billing_api.sync_all_withdrawals(),
+            billing_api.sync_all_deposits(),
+            return_exceptions=True,
+        )
+        for name, result in zip(
+            ["User info", "User list", "Transfers", "Withdrawals", "Deposits"],
+            results,
+        ):
+            show(name, result)
+
+        # 批量转账：每笔转账有自己的 request_id，失败后可安全重试
+        try:
+            transfers = await transfer_api.account_transfer_many([
+                {"request_id": "transfer_001", "symbol": "USDT", "amount": "1",
+                 "from": "15036904", "to": "1123"},
+                {"request_id": "transfer_002", "symbol": "USDT", "amount": "2",
+                 "from": "15036904", "to": "1124"},
+            ])
+            print(f"Transfer results: {transfers}")
+        except ApiError as e:
+            print(f"批量转账失败: {e}")
+    finally:
+        # 异步会话属于当前事件循环，退出前关闭
+        for api in (user_api, transfer_api, billing_api):
+            await api.close_async()
+        client.close()
+
+
+async def mpc_main():
+    # 创建 MPC 客户端
+    mpc_client = (
+        MpcClient.new_builder()
+        .set_app_id("")
+        .set_rsa_private_key("")
+        .set_sign_private_key("")
+        .set_waas_public_key("")
+        .build()
+    )
+    sub_wallet_id = 1000537
+    wallet_api = mpc_client.get_wallet_api()
+    deposit_api = mpc_client.get_deposit_api()
+    workspace_api = mpc_client.get_workspace_api()
+
+    # 同步 API 共享同一个连接池，在线程池中运行即可并发
+    loop = asyncio.get_running_loop()
+
+    def run(func, *args):
+        return loop.run_in_executor(None, func, *args)
+
+    try:
+        results = await asyncio.gather(
+            run(wallet_api.get_wallet_assets, {"sub_wallet_id": sub_wallet_id, "symbol": "ETH"}),
+            run(wallet_api.query_wallet_address,
+                {"sub_wallet_id": sub_wallet_id, "symbol": "ETH", "max_id": 0}),
+            run(deposit_api.sync_deposit_records, 0),
+            run(workspace_api.get_support_main_chain),
+            run(workspace_api.get_last_block_height, {"base_symbol": "ETH"}),
+            return_exceptions=True,
+        )
+        for name, result in zip(
+            ["Wallet assets", "Wallet addresses", "Deposits", "Chains", "Block height"],
+            results,
+        ):
+            show(name, result)
+    finally:
+        mpc_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(waas_main())
+    asyncio.run(mpc_main())
@@ -3,13 +3,11 @@
 """
 自定义加密提供者示例
 """
-import sys
-import os
+from _bootstrap import ensure_sdk
 
-# 添加项目根目录到 Python 路径（允许在不安装的情况下运行）
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+ensure_sdk()
 
-from chainup_custody_sdk import WaasClient, ICryptoProvider
+from chainup_custody_sdk import WaasClient, ICryptoProvider  # noqa: E402
 
 
 class MyCustomCryptoProvider(ICryptoProvider):
@@ -3,26 +3,11 @@
 """
 MPC API 使用示例
 """
-import sys
-import os
-
-# 添加项目根目录到 Python 路径（允许在不安装的情况下运行）
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-# 检查依赖
-try:
-    from chainup_custody_sdk import MpcClient, ApiError
-except ImportError as e:
-    print("=" * 60)
-    print("❌ 缺少必要的依赖")
-    print("=" * 60)
-    print(f"\n错误: {e}\n")
-    print("请先安装依赖:")
-    print("  pip3 install pycryptodome requests")
-    print("\n或者:")
-    print("  pip3 install -r requirements.txt")
-    print("=" * 60)
-    sys.exit(1)
+from _bootstrap import ensure_sdk, load_fixture
+
+ensure_sdk()
+
+from chainup_custody_sdk import MpcClient, ApiError  # noqa: E402
 
 
 def main():
@@ -272,7 +257,7 @@ def main():
     notify_api = mpc_client.get_notify_api()
 
     # 解密通知数据（在 webhook 回调中使用）
-    encrypted_data = "Af-uUJj8a2-Og7E5CwzANv4vo8NMf-z-DijwrIuK74Or8eRveM7G_-f0ErtX4WurcVrjdWC-tqU0BDhBwiDijbdyCFBvYB5UmLnHL_Rg13amhQTM-kaHoh-U9WPhYB3vGRwWkTwJ_aETERVVciAvoTf5CalqydMSe8G3KNz-ymrSVUe92DfW5ZdDKJm1hNYYteGJvg0hk--GRiPybPv2W78NlTLyWmXq094megsVzZv-KlsEGPUvPoBnEJ0Xu__AO-l-GfCG4rVO4rb8J01Nq_0Q9eRKcKWq0ci7MfnPPLMhtAWwRvSd3U8PUNHOLqGaJzOLraFnuFUHn90h7T23_DeAduA2W6dto99qb8YQ_iVnMnOKfE0Ls7Vv5S2qhgQJ0nl-BA3PPPOwW37cMb-wTbi3ZezU_S1NQEbrruEChkPhTaK0AqsM6mESV8wGflcWx3N9XPv6QatJ9zedBnkfJ4bJ4Vy2rUEtQF8eVc6zXhV8PuDRiSMf0V0yxzMjE6o9z0s087KSAqFphitlHvQMPJ29FUnyvCe_Czr5WPuhl89GOZjERE2uoNTfHqAlZVzMamoPv4y0qyIjJTufAQm-WwrQK9kGesky7eCiOXVdtR9UhEYpzEJSgXxENjUrHMx6D2AlEzlr17a2DgI-WrWB7oUnyiNnf__ElmLPPkJBdFUfzJByQkLxkUB0FLvTWdVbiIRPmPpdgb7jkhJsHUSOH0NmULqu8bYiEQtGfqRJh8I98qDzHWwfE_VAbqwATj2oD959Fm1eInBqh7eXGoy2WR3o00VpPrNvoE4eJNmw3WpVzlRF7ZVwOpcWRT-dHTShz9mB2Etk9P8D4rGmMZyXHkt4aGUJkE1b3cOEjzkOEFX8CaNe-VHiBYhIyFzMetn7mfIFB0hl565FGEumbhDKNNz_m9T2qPM5k4BQ9fLWUt_WJAVdC81_piIlBOQfYPDbdYoc_9ser1p-Jy5cgTyOMdWuSWC3jMsT09xr8dMcLkKmd39khGidAvGqOOPL1ST0"
+    encrypted_data = load_fixture("mpc_notify_sample.txt")
     notify_data = notify_api.notify_request(encrypted_data)
     if notify_data:
         print(f"Notify type: {notify_data['side']}")  # 'deposit' or 'withdraw'
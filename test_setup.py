@@ -6,6 +6,8 @@
 
 import sys
 import os
+import py_compile
+from importlib.util import find_spec
 
 print("=" * 60)
 print("ChainUp Custody Python SDK - 快速测试")
@@ -32,10 +34,10 @@ example_files = [
 
 for file in example_files:
     try:
-        with open(file, 'r', encoding='utf-8') as f:
-            compile(f.read(), file, 'exec')
+        # 编译结果写入 __pycache__，运行示例时可直接加载
+        py_compile.compile(file, doraise=True)
         print(f"   ✅ {file}")
-    except SyntaxError as e:
+    except py_compile.PyCompileError as e:
         print(f"   ❌ {file}: {e}")
         sys.exit(1)
 
@@ -48,10 +50,10 @@ dependencies = {
 
 missing = []
 for module, package in dependencies.items():
-    try:
-        __import__(module)
+    # 只查找模块，不执行其初始化代码
+    if find_spec(module) is not None:
         print(f"   ✅ {package}")
-    except ImportError:
+    else:
         print(f"   ❌ {package} (未安装)")
         missing.append(package)
 
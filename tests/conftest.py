@@ -0,0 +1,56 @@
+"""
+Shared pytest configuration
+"""
+from importlib.util import find_spec
+
+import pytest
+
+# Modules the SDK cannot be imported without, mapped to their packages
+REQUIRED_MODULES = {
+    "requests": "requests",
+    "Crypto": "pycryptodome",
+}
+
+# Set in config.stash once the installation check has passed
+installation_verified = pytest.StashKey[bool]()
+
+
+@pytest.fixture(scope="session")
+def rsa_key():
+    """Generate one RSA key pair for the whole session."""
+    from Crypto.PublicKey import RSA
+
+    return RSA.generate(2048)
+
+
+@pytest.fixture(scope="session")
+def provider(rsa_key):
+    """RsaCryptoProvider using the generated key pair."""
+    from chainup_custody_sdk.utils.crypto_provider import RsaCryptoProvider
+
+    return RsaCryptoProvider(
+        private_key=rsa_key.export_key(pkcs=8).decode(),
+        public_key=rsa_key.publickey().export_key().decode(),
+    )
+
+
+def pytest_configure(config):
+    """
+    Checks once per session that the SDK dependencies are installed, so a
+    broken environment fails with one clear message instead of an import
+    error per test module.
+    """
+    if hasattr(config, "workerinput"):
+        # pytest-xdist worker: the controlling process has already checked
+        return
+
+    missing = [
+        package for module, package in REQUIRED_MODULES.items()
+        if find_spec(module) is None
+    ]
+    if missing:
+        raise pytest.UsageError(
+            f"Missing SDK dependencies: {', '.join(missing)} "
+            f"(install with: pip install -e \".[dev]\")"
+        )
+    config.stash[installation_verified] = True
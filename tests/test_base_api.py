@@ -0,0 +1,59 @@
+"""
+Unit tests for WaaS BaseApi request building and response decoding
+"""
+import json
+
+import pytest
+
+from chainup_custody_sdk.waas.api.base_api import BaseApi
+from chainup_custody_sdk.waas.waas_config import WaasConfig
+
+
+@pytest.fixture
+def api(rsa_key):
+    """BaseApi using the generated key pair."""
+    return BaseApi(WaasConfig(
+        app_id="test",
+        private_key=rsa_key.export_key(pkcs=8).decode(),
+        public_key=rsa_key.publickey().export_key().decode(),
+    ))
+
+
+class TestRequestArgs:
+    """Tests for WaaS request args serialization."""
+
+    def test_prebuilt_body_matches_dict(self, api):
+        """Test a pre-serialized body yields the same args as a dict."""
+        args = json.loads(api._build_request_args({"uid": 1, "symbol": "ETH"}))
+        body_args = json.loads(api._build_request_args('{"uid":1,"symbol":"ETH"}'))
+        assert body_args.keys() == args.keys()
+        assert body_args["uid"] == 1 and body_args["charset"] == "UTF-8"
+
+    def test_prebuilt_body_common_fields_not_duplicated(self, api):
+        """Test time/charset already in a pre-serialized body are replaced, not repeated."""
+        raw = api._build_request_args('{"uid":1,"time":5,"charset":"latin-1"}')
+        assert raw.count('"time"') == 1 and raw.count('"charset"') == 1
+        args = json.loads(raw)
+        assert args["time"] != 5 and args["charset"] == "UTF-8"
+
+    def test_prebuilt_body_must_be_object(self, api):
+        """Test a pre-serialized body that is not a JSON object is rejected."""
+        with pytest.raises(ValueError):
+            api._build_request_args('[1, 2]')
+
+
+class TestResponseDecoding:
+    """Tests for WaaS response envelope decoding."""
+
+    def test_encrypted_envelope(self, api, provider):
+        """Test encrypted data is decrypted from a plain envelope."""
+        cipher = provider.encrypt_with_private_key('{"code":0,"data":[1,2]}')
+        text = '{"code": 0, "msg": "ok", "data": "' + cipher + '"}'
+        assert api._decode_response(text) == {"code": 0, "data": [1, 2]}
+
+    def test_unencrypted_response(self, api):
+        """Test responses without encrypted data are returned parsed."""
+        text = '{"code": 10001, "msg": "bad \\"sign\\"", "data": null}'
+        assert api._decode_response(text) == {
+            "code": 10001, "msg": 'bad "sign"', "data": None
+        }
@@ -1,142 +1,446 @@
 """
 Unit tests for client classes
 """
+import asyncio
 import pytest
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
 from unittest.mock import Mock, patch
 from chainup_custody_sdk import WaasClient, MpcClient
 from chainup_custody_sdk.waas.waas_config import WaasConfig
 from chainup_custody_sdk.mpc.mpc_config import MpcConfig
+from chainup_custody_sdk.waas.api.user_api import UserApi
+from chainup_custody_sdk.waas.api.account_api import AccountApi
+from chainup_custody_sdk.waas.api.billing_api import BillingApi
+from chainup_custody_sdk.mpc.api.wallet_api import WalletApi
+from chainup_custody_sdk.mpc.api.deposit_api import DepositApi
+from chainup_custody_sdk.mpc.api.withdraw_api import WithdrawApi
+from chainup_custody_sdk.utils import http_client as http_module
+
+
+@pytest.fixture
+def waas_client():
+    """WaaS client with placeholder credentials, closed after the test."""
+    client = (
+        WaasClient.builder()
+        .set_app_id("test")
+        .set_private_key("key")
+        .set_public_key("key")
+        .build()
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def mpc_client():
+    """MPC client with placeholder credentials, closed after the test."""
+    client = (
+        MpcClient.builder()
+        .set_app_id("test")
+        .set_rsa_private_key("key")
+        .build()
+    )
+    yield client
+    client.close()
+
+
+@dataclass(frozen=True)
+class ClientSpec:
+    """Builder setters and API factories of one client type."""
+
+    cls: type
+    # Builder setter -> value; each sets the config field named after it
+    setters: Dict[str, Any]
+    # API factory method -> class it returns
+    apis: Tuple[Tuple[str, type], ...]
+
+    def build(self):
+        """Builds a client by calling every setter."""
+        builder = self.cls.builder()
+        for setter, value in self.setters.items():
+            getattr(builder, setter)(value)
+        return builder.build()
+
+
+WAAS_SPEC = ClientSpec(
+    cls=WaasClient,
+    setters={
+        "set_app_id": "test-app",
+        "set_private_key": "test-private-key",
+        "set_public_key": "test-public-key",
+        "set_debug": True,
+    },
+    apis=(
+        ("get_user_api", UserApi),
+        ("get_account_api", AccountApi),
+        ("get_billing_api", BillingApi),
+    ),
+)
+
+MPC_SPEC = ClientSpec(
+    cls=MpcClient,
+    setters={
+        "set_app_id": "test-app",
+        "set_rsa_private_key": "test-private-key",
+        "set_waas_public_key": "test-public-key",
+        "set_sign_private_key": "sign-key",
+        "set_debug": True,
+    },
+    apis=(
+        ("get_wallet_api", WalletApi),
+        ("get_deposit_api", DepositApi),
+        ("get_withdraw_api", WithdrawApi),
+    ),
+)
+
+
+@pytest.fixture(params=[WAAS_SPEC, MPC_SPEC], ids=["waas", "mpc"])
+def client_spec(request):
+    """Spec of each client type, for behaviour both clients share."""
+    return request.param
+
+
+class TestClients:
+    """Tests shared by WaasClient and MpcClient."""
+
+    def test_builder_pattern(self, client_spec):
+        """Test builder pattern creates client correctly."""
+        client = client_spec.build()
+        for setter, value in client_spec.setters.items():
+            assert getattr(client.config, setter[len("set_"):]) == value
+        client.close()
+
+    def test_context_manager(self, client_spec):
+        """Test context manager support."""
+        client = client_spec.build()
+        with client as c:
+            assert c._closed is False
+
+        assert client._closed is True
+
+    def test_api_factories(self, client_spec):
+        """Test API factory methods return correct types."""
+        client = client_spec.build()
+        for getter, api_cls in client_spec.apis:
+            assert type(getattr(client, getter)()) is api_cls
+        client.close()
 
 
 class TestWaasClient:
     """Tests for WaasClient."""
     
-    def test_builder_pattern(self):
-        """Test builder pattern creates client correctly."""
-        client = (
-            WaasClient.builder()
-            .set_app_id("test-app")
-            .set_private_key("test-private-key")
-            .set_public_key("test-public-key")
-            .set_debug(True)
-            .build()
-        )
-        assert client.config.app_id == "test-app"
-        assert client.config.debug is True
-    
     def test_new_builder_alias(self):
         """Test new_builder is alias for builder."""
         builder1 = WaasClient.builder()
         builder2 = WaasClient.new_builder()
-        assert type(builder1) == type(builder2)
+        assert type(builder1) is type(builder2)
     
-    def test_context_manager(self):
-        """Test context manager support."""
+    def test_close_releases_shared_http_client(self, waas_client):
+        """Test close() closes the HTTP client shared by API instances."""
+        http_client = waas_client.get_user_api().http_client
+        assert waas_client.get_coin_api().http_client is http_client
+
+        with patch.object(http_client, "close") as close:
+            waas_client.close()
+        close.assert_called_once()
+        assert waas_client.get_user_api().http_client is not http_client
+
+    def test_open_http_clients_closed_at_exit(self, waas_client):
+        """Test HTTP clients are tracked for closing at exit until closed."""
+        shared = waas_client.get_user_api().http_client
+        assert shared in http_module._open_clients
+        waas_client.close()
+        assert shared not in http_module._open_clients
+
+    def test_retry_total(self):
+        """Test set_retry_total configures the session retry policy."""
         client = (
             WaasClient.builder()
             .set_app_id("test")
             .set_private_key("key")
             .set_public_key("key")
+            .set_retry_total(5)
             .build()
         )
-        
-        with client as c:
-            assert c._closed is False
-        
-        assert client._closed is True
-    
-    def test_get_api_instances(self):
-        """Test API factory methods return correct types."""
+        retry = client.get_user_api().http_client.session.get_adapter("https://").max_retries
+        assert retry.total == 5
+        assert 503 in retry.status_forcelist
+        client.close()
+
+    def test_http2_client(self):
+        """Test set_http2 switches APIs to the HTTP/2 client."""
+        pytest.importorskip("httpx")
+        from chainup_custody_sdk.utils.http2_client import Http2Client
+
         client = (
             WaasClient.builder()
             .set_app_id("test")
             .set_private_key("key")
             .set_public_key("key")
+            .set_http2(True)
             .build()
         )
-        
-        from chainup_custody_sdk.waas.api.user_api import UserApi
-        from chainup_custody_sdk.waas.api.account_api import AccountApi
-        from chainup_custody_sdk.waas.api.billing_api import BillingApi
-        
-        assert isinstance(client.get_user_api(), UserApi)
-        assert isinstance(client.get_account_api(), AccountApi)
-        assert isinstance(client.get_billing_api(), BillingApi)
+        assert isinstance(client.get_user_api().http_client, Http2Client)
+        client.close()
+
+    def test_http_client_resolves_url_once(self, waas_client):
+        """Test the HTTP client resolves each API path to a URL only once."""
+        http_client = waas_client.get_user_api().http_client
+        response = Mock(status_code=200, text="{}")
+        with patch.object(http_client.session, "post", return_value=response) as post, \
+                patch.object(WaasConfig, "get_url", autospec=True,
+                             side_effect=lambda config, path: "https://host/" + path) as get_url:
+            http_client.request("POST", "user/info", {})
+            http_client.request("POST", "user/info", {})
+        assert get_url.call_count == 1
+        assert post.call_args[0][0] == "https://host/user/info"
+
+    def test_api_instances_are_cached(self, waas_client):
+        """Test factory methods return the same instance on repeated calls."""
+        assert waas_client.get_user_api() is waas_client.get_user_api()
+        assert waas_client.get_billing_api() is waas_client.get_billing_api()
 
 
 class TestMpcClient:
     """Tests for MpcClient."""
     
-    def test_builder_pattern(self):
-        """Test builder pattern creates client correctly."""
-        client = (
-            MpcClient.builder()
-            .set_app_id("test-app")
-            .set_rsa_private_key("test-private-key")
-            .set_waas_public_key("test-public-key")
-            .set_sign_private_key("sign-key")
-            .set_debug(True)
-            .build()
-        )
-        assert client.config.app_id == "test-app"
-        assert client.config.sign_private_key == "sign-key"
-        assert client.config.debug is True
-    
-    def test_context_manager(self):
-        """Test context manager support."""
-        client = (
-            MpcClient.builder()
-            .set_app_id("test")
-            .set_rsa_private_key("key")
-            .build()
-        )
-        
-        with client as c:
-            assert c._closed is False
-        
-        assert client._closed is True
-    
-    def test_get_api_instances(self):
-        """Test API factory methods return correct types."""
+    def test_api_instances_are_cached(self, mpc_client):
+        """Test factory methods return the same instance on repeated calls."""
+        notify_api = mpc_client.get_notify_api()
+        assert mpc_client.get_notify_api() is notify_api
+        assert mpc_client.get_wallet_api() is mpc_client.get_wallet_api()
+        mpc_client.close()
+        assert mpc_client.get_notify_api() is not notify_api
+
+    def test_retries_disabled_by_default(self):
+        """Test MPC requests are not retried unless set_retry_total is called."""
+        client = MpcClient.builder().set_app_id("test").set_rsa_private_key("key").build()
+        http_client = client.get_wallet_api().http_client
+        assert http_client.session.get_adapter("https://").max_retries.total == 0
+        client.close()
+
+    def test_retry_total(self):
+        """Test set_retry_total enables MPC request retries."""
         client = (
             MpcClient.builder()
             .set_app_id("test")
             .set_rsa_private_key("key")
+            .set_retry_total(2)
             .build()
         )
-        
-        from chainup_custody_sdk.mpc.api.wallet_api import WalletApi
-        from chainup_custody_sdk.mpc.api.deposit_api import DepositApi
-        from chainup_custody_sdk.mpc.api.withdraw_api import WithdrawApi
-        
-        assert isinstance(client.get_wallet_api(), WalletApi)
-        assert isinstance(client.get_deposit_api(), DepositApi)
-        assert isinstance(client.get_withdraw_api(), WithdrawApi)
+        http_client = client.get_wallet_api().http_client
+        assert http_client.session.get_adapter("https://").max_retries.total == 2
+        client.close()
 
 
 class TestClientBuilderChaining:
     """Tests for builder method chaining."""
     
-    def test_waas_builder_returns_self(self):
+    @pytest.mark.parametrize("method,arg", [
+        ("set_app_id", "test"),
+        ("set_private_key", "key"),
+        ("set_public_key", "key"),
+        ("set_host", "https://test.com"),
+        ("set_version", "v3"),
+        ("set_charset", "UTF-8"),
+        ("set_debug", True),
+    ])
+    def test_waas_builder_returns_self(self, method, arg):
         """Test WaaS builder methods return self for chaining."""
         builder = WaasClient.builder()
-        
-        assert builder.set_app_id("test") is builder
-        assert builder.set_private_key("key") is builder
-        assert builder.set_public_key("key") is builder
-        assert builder.set_host("https://test.com") is builder
-        assert builder.set_version("v3") is builder
-        assert builder.set_charset("UTF-8") is builder
-        assert builder.set_debug(True) is builder
-    
-    def test_mpc_builder_returns_self(self):
+        assert getattr(builder, method)(arg) is builder
+
+    @pytest.mark.parametrize("method,arg", [
+        ("set_app_id", "test"),
+        ("set_rsa_private_key", "key"),
+        ("set_waas_public_key", "key"),
+        ("set_sign_private_key", "key"),
+        ("set_domain", "https://test.com"),
+        ("set_api_key", "key"),
+        ("set_debug", True),
+    ])
+    def test_mpc_builder_returns_self(self, method, arg):
         """Test MPC builder methods return self for chaining."""
         builder = MpcClient.builder()
-        
-        assert builder.set_app_id("test") is builder
-        assert builder.set_rsa_private_key("key") is builder
-        assert builder.set_waas_public_key("key") is builder
-        assert builder.set_sign_private_key("key") is builder
-        assert builder.set_domain("https://test.com") is builder
-        assert builder.set_api_key("key") is builder
-        assert builder.set_debug(True) is builder
+        assert getattr(builder, method)(arg) is builder
+
+
+class TestAsyncWaasApi:
+    """Tests for async WaaS requests."""
+
+    def test_sync_all_withdrawals_follows_pagination(self, waas_client):
+        """Test sync_all_withdrawals pages by max_id until an empty page."""
+        pages = [
+            {"code": 0, "data": [{"id": 1}, {"id": 2}]},
+            {"code": 0, "data": [{"id": 3}]},
+            {"code": 0, "data": []},
+        ]
+        with patch(
+            "chainup_custody_sdk.waas.api.base_api.BaseApi.post_async",
+            side_effect=pages,
+        ) as post_async:
+            records = asyncio.run(
+                waas_client.get_billing_api().sync_all_withdrawals()
+            )
+
+        assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert [c.args[1]["max_id"] for c in post_async.call_args_list] == [0, 2, 3]
+
+    def test_account_transfer_many_preserves_order(self, waas_client):
+        """Test account_transfer_many returns results in request order."""
+        async def fake_post_async(path, params):
+            return {"code": 0, "data": {"request_id": params["request_id"]}}
+
+        params_list = [{"request_id": str(i)} for i in range(3)]
+        with patch(
+            "chainup_custody_sdk.waas.api.base_api.BaseApi.post_async",
+            side_effect=fake_post_async,
+        ):
+            results = waas_client.get_transfer_api().account_transfer_many_sync(
+                params_list
+            )
+
+        assert [r["request_id"] for r in results] == ["0", "1", "2"]
+
+    def test_account_transfer_many_limits_concurrency(self, waas_client):
+        """Test account_transfer_many keeps at most `concurrency` transfers in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_post_async(path, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"code": 0, "data": {"request_id": params["request_id"]}}
+
+        params_list = [{"request_id": str(i)} for i in range(6)]
+        with patch(
+            "chainup_custody_sdk.waas.api.base_api.BaseApi.post_async",
+            side_effect=fake_post_async,
+        ):
+            waas_client.get_transfer_api().account_transfer_many_sync(
+                params_list, concurrency=2
+            )
+
+        assert peak == 2
+
+    def test_get_users_batch_preserves_order(self, waas_client):
+        """Test get_users_batch returns results in query order."""
+        async def fake_post_async(path, params):
+            return {"code": 0, "data": dict(params)}
+
+        queries = [{"email": "a@example.com"}, {"country": "86", "mobile": "1"}]
+        with patch(
+            "chainup_custody_sdk.waas.api.base_api.BaseApi.post_async",
+            side_effect=fake_post_async,
+        ):
+            results = waas_client.get_user_api().get_users_batch_sync(queries)
+
+        assert results == queries
+
+    def test_sync_account_transfer_list_async(self, waas_client):
+        """Test the async transfer sync posts max_id and unwraps data."""
+        async def fake_post_async(path, params):
+            return {"code": 0, "data": [{"id": params["max_id"] + 1}]}
+
+        with patch(
+            "chainup_custody_sdk.waas.api.base_api.BaseApi.post_async",
+            side_effect=fake_post_async,
+        ) as post_async:
+            records = asyncio.run(
+                waas_client.get_transfer_api().sync_account_transfer_list_async(5)
+            )
+
+        assert records == [{"id": 6}]
+        assert post_async.call_args.args[0] == "/account/syncTransferList"
+
+
+class TestSyncIterators:
+    """Tests for paginated sync iterators."""
+
+    def test_iter_user_list_follows_pagination(self, waas_client):
+        """Test iter_user_list yields every record across pages."""
+        pages = {0: [{"id": 1}, {"id": 2}], 2: [{"id": 5}], 5: []}
+        user_api = waas_client.get_user_api()
+        with patch.object(
+            type(user_api), "sync_user_list", side_effect=lambda max_id: pages[max_id]
+        ):
+            records = list(user_api.iter_user_list())
+
+        assert [r["id"] for r in records] == [1, 2, 5]
+
+    def test_iter_deposit_records_follows_pagination(self, mpc_client):
+        """Test the MPC deposit iterator yields every record across pages."""
+        pages = {0: [{"id": 3}], 3: [{"id": 4}], 4: []}
+        deposit_api = mpc_client.get_deposit_api()
+        with patch.object(
+            type(deposit_api), "sync_deposit_records",
+            side_effect=lambda max_id: pages[max_id],
+        ):
+            records = list(deposit_api.iter_deposit_records())
+
+        assert [r["id"] for r in records] == [3, 4]
+
+
+class TestTransferBatching:
+    """Tests for batched transfer lookups."""
+
+    def test_get_transfers_chunks_ids(self, waas_client):
+        """Test get_transfers splits ids into batches and keeps their order."""
+        transfer_api = waas_client.get_transfer_api()
+
+        def fake_list(params):
+            return [{"request_id": i} for i in params["ids"].split(",")]
+
+        with patch.object(
+            type(transfer_api), "get_account_transfer_list", side_effect=fake_list
+        ) as get_list:
+            records = transfer_api.get_transfers([str(i) for i in range(5)], chunk=2)
+
+        assert get_list.call_count == 3
+        assert [r["request_id"] for r in records] == ["0", "1", "2", "3", "4"]
+
+    def test_get_withdraw_records_bulk_chunks_ids(self, mpc_client):
+        """Test MPC bulk record lookups split ids into batches and keep their order."""
+        withdraw_api = mpc_client.get_withdraw_api()
+
+        def fake_records(request_ids):
+            return [{"request_id": i} for i in request_ids]
+
+        with patch.object(
+            type(withdraw_api), "get_withdraw_records", side_effect=fake_records
+        ) as get_records:
+            records = withdraw_api.get_withdraw_records_bulk(range(5), chunk=2)
+
+        assert get_records.call_count == 3
+        assert [r["request_id"] for r in records] == [0, 1, 2, 3, 4]
+
+    def test_fetch_transaction_bundle_queries_non_empty_lists(self, waas_client):
+        """Test only the non-empty ID lists are queried and results keyed by type."""
+        billing_api = waas_client.get_billing_api()
+        billing_class = type(billing_api)
+        with patch.object(
+            billing_class, "withdraw_list", return_value=[{"id": "w"}]
+        ) as withdraw_list, patch.object(
+            billing_class, "deposit_list", return_value=[{"id": "d"}]
+        ) as deposit_list, patch.object(billing_class, "miner_fee_list") as fee_list:
+            bundle = billing_api.fetch_transaction_bundle(
+                withdraw_ids=["w1"], deposit_ids=["1", "2"], fee_ids=[]
+            )
+
+        withdraw_list.assert_called_once_with(["w1"])
+        deposit_list.assert_called_once_with(["1", "2"])
+        fee_list.assert_not_called()
+        assert bundle == {"withdraw": [{"id": "w"}], "deposit": [{"id": "d"}], "miner_fee": []}
+
+    def test_fetch_transaction_bundle_empty(self, waas_client):
+        """Test no request is made when no IDs are given."""
+        billing_api = waas_client.get_billing_api()
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post") as post:
+            bundle = billing_api.fetch_transaction_bundle()
+
+        post.assert_not_called()
+        assert bundle == {"withdraw": [], "deposit": [], "miner_fee": []}
@@ -1,11 +1,45 @@
 """
 Unit tests for config classes
 """
+import dataclasses
+from types import MappingProxyType
+from typing import Final
+
 import pytest
 from chainup_custody_sdk.waas.waas_config import WaasConfig
 from chainup_custody_sdk.mpc.mpc_config import MpcConfig
 from chainup_custody_sdk.exceptions import ConfigError
 
+# Expected URLs for the default hosts
+_WAAS_URL: Final = "https://openapi.chainup.com/v2/user/info"
+_MPC_URL: Final = "https://openapi.chainup.com/api/mpc/wallet/create"
+
+# Read-only from_dict inputs
+_WAAS_CONFIG_DATA = MappingProxyType({
+    "app_id": "test-app",
+    "private_key": "private",
+    "public_key": "public",
+    "debug": True
+})
+_MPC_CONFIG_DATA = MappingProxyType({
+    "app_id": "test-app",
+    "rsa_private_key": "private",
+    "waas_public_key": "public",
+    "sign_private_key": "sign-key"
+})
+
+
+@pytest.fixture(scope="module")
+def waas_config_from_dict():
+    """WaasConfig built from _WAAS_CONFIG_DATA."""
+    return WaasConfig.from_dict(_WAAS_CONFIG_DATA)
+
+
+@pytest.fixture(scope="module")
+def mpc_config_from_dict():
+    """MpcConfig built from _MPC_CONFIG_DATA."""
+    return MpcConfig.from_dict(_MPC_CONFIG_DATA)
+
 
 class TestWaasConfig:
     """Tests for WaasConfig."""
@@ -20,27 +54,13 @@ class TestWaasConfig:
         assert config.validate() is True
         assert config.app_id == "test-app"
     
-    def test_missing_app_id(self):
-        """Test missing app_id raises ConfigError."""
-        config = WaasConfig(
-            app_id="",
-            private_key="key",
-            public_key="key"
-        )
-        with pytest.raises(ConfigError) as exc_info:
-            config.validate()
-        assert "app_id" in str(exc_info.value)
-    
-    def test_missing_private_key(self):
-        """Test missing private_key raises ConfigError."""
-        config = WaasConfig(
-            app_id="test-app",
-            private_key="",
-            public_key="key"
-        )
-        with pytest.raises(ConfigError) as exc_info:
-            config.validate()
-        assert "private_key" in str(exc_info.value)
+    @pytest.mark.parametrize("field", ["app_id", "private_key"])
+    def test_missing_field(self, field):
+        """Test a missing required field raises ConfigError naming it."""
+        kwargs = dict(app_id="test-app", private_key="key", public_key="key")
+        kwargs[field] = ""
+        with pytest.raises(ConfigError, match=field):
+            WaasConfig(**kwargs).validate()
     
     def test_get_url(self):
         """Test URL generation."""
@@ -49,8 +69,7 @@ class TestWaasConfig:
             private_key="key",
             public_key="key"
         )
-        url = config.get_url("/user/info")
-        assert url == "https://openapi.chainup.com/v2/user/info"
+        assert config.get_url("/user/info") == _WAAS_URL
     
     def test_host_normalization(self):
         """Test host URL is normalized with trailing slash."""
@@ -61,18 +80,33 @@ class TestWaasConfig:
             host="https://api.test.com"
         )
         assert config.host.endswith("/")
+
+    def test_frozen(self):
+        """Test config fields cannot be reassigned."""
+        config = WaasConfig(app_id="test", private_key="key", public_key="key")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.host = "https://other.example.com/"
+
+    def test_shared_state_not_compared(self):
+        """Test validation and shared client state leave equality and hash alone."""
+        config = WaasConfig(app_id="test", private_key="key", public_key="key")
+        other = WaasConfig(app_id="test", private_key="key", public_key="key")
+        config.validate()
+        config._shared_http_clients[object] = object()
+        assert config == other
+        assert hash(config) == hash(other)
+        assert "_validated" not in repr(config)
     
-    def test_from_dict(self):
+    def test_from_dict(self, waas_config_from_dict):
         """Test creating config from dictionary."""
-        data = {
-            "app_id": "test-app",
-            "private_key": "private",
-            "public_key": "public",
-            "debug": True
-        }
-        config = WaasConfig.from_dict(data)
-        assert config.app_id == "test-app"
-        assert config.debug is True
+        assert waas_config_from_dict.app_id == "test-app"
+        assert waas_config_from_dict.debug is True
+
+    def test_from_dict_redis_client(self):
+        """Test from_dict passes the Redis client through."""
+        redis_client = object()
+        config = WaasConfig.from_dict({**_WAAS_CONFIG_DATA, "redis_client": redis_client})
+        assert config.redis_client is redis_client
 
 
 class TestMpcConfig:
@@ -86,25 +120,13 @@ class TestMpcConfig:
         )
         assert config.validate() is True
     
-    def test_missing_app_id(self):
-        """Test missing app_id raises ConfigError."""
-        config = MpcConfig(
-            app_id="",
-            rsa_private_key="key"
-        )
-        with pytest.raises(ConfigError) as exc_info:
-            config.validate()
-        assert "app_id" in str(exc_info.value)
-    
-    def test_missing_rsa_key(self):
-        """Test missing rsa_private_key raises ConfigError."""
-        config = MpcConfig(
-            app_id="test-app",
-            rsa_private_key=""
-        )
-        with pytest.raises(ConfigError) as exc_info:
-            config.validate()
-        assert "rsa_private_key" in str(exc_info.value)
+    @pytest.mark.parametrize("field", ["app_id", "rsa_private_key"])
+    def test_missing_field(self, field):
+        """Test a missing required field raises ConfigError naming it."""
+        kwargs = dict(app_id="test-app", rsa_private_key="key")
+        kwargs[field] = ""
+        with pytest.raises(ConfigError, match=field):
+            MpcConfig(**kwargs).validate()
     
     def test_get_url(self):
         """Test URL generation."""
@@ -112,17 +134,9 @@ class TestMpcConfig:
             app_id="test",
             rsa_private_key="key"
         )
-        url = config.get_url("/api/mpc/wallet/create")
-        assert url == "https://openapi.chainup.com/api/mpc/wallet/create"
+        assert config.get_url("/api/mpc/wallet/create") == _MPC_URL
     
-    def test_from_dict(self):
+    def test_from_dict(self, mpc_config_from_dict):
         """Test creating config from dictionary."""
-        data = {
-            "app_id": "test-app",
-            "rsa_private_key": "private",
-            "waas_public_key": "public",
-            "sign_private_key": "sign-key"
-        }
-        config = MpcConfig.from_dict(data)
-        assert config.app_id == "test-app"
-        assert config.sign_private_key == "sign-key"
+        assert mpc_config_from_dict.app_id == "test-app"
+        assert mpc_config_from_dict.sign_private_key == "sign-key"
@@ -0,0 +1,66 @@
+"""
+Unit tests for crypto provider
+"""
+import base64
+import hashlib
+
+import pytest
+from Crypto.Hash import SHA256
+from Crypto.Signature import pkcs1_15
+
+from chainup_custody_sdk.utils.crypto_provider import RsaCryptoProvider, Sha256Digest
+from chainup_custody_sdk.utils.mpc_sign_util import MpcSignUtil
+
+
+class TestRsaCryptoProvider:
+    """Tests for RsaCryptoProvider."""
+
+    def test_encrypt_decrypt_roundtrip(self, provider):
+        """Test private-key encryption can be decrypted with public key."""
+        data = '{"uid":12345,"symbol":"ETH","remark":"' + "x" * 600 + '"}'
+        encrypted = provider.encrypt_with_private_key(data)
+        assert provider.decrypt_with_public_key(encrypted) == data
+
+    def test_sign_matches_sha256(self, provider, rsa_key):
+        """Test signature matches pkcs1_15 with Crypto.Hash.SHA256."""
+        data = "amount=1.0001&symbol=eth"
+        md5_hex = hashlib.md5(data.encode()).hexdigest().encode()
+        expected = pkcs1_15.new(rsa_key).sign(SHA256.new(md5_hex))
+        assert base64.b64decode(provider.sign(data)) == expected
+
+    def test_sign_util_matches_provider(self, provider, rsa_key):
+        """Test MpcSignUtil.sign and provider.sign produce the same signature."""
+        data = "amount=1.0001&symbol=eth"
+        private_pem = rsa_key.export_key(pkcs=8).decode()
+        assert MpcSignUtil.sign(data, private_pem) == provider.sign(data)
+
+    def test_sign_util_key_parsed_once(self, rsa_key):
+        """Test MpcSignUtil reuses the parsed key for the same PEM."""
+        from chainup_custody_sdk.utils.mpc_sign_util import _load_sign_key
+
+        private_pem = rsa_key.export_key(pkcs=8).decode()
+        MpcSignUtil.sign("a=1", private_pem)
+        hits = _load_sign_key.cache_info().hits
+        MpcSignUtil.sign("a=2", private_pem)
+        assert _load_sign_key.cache_info().hits == hits + 1
+
+    def test_verify(self, provider, rsa_key):
+        """Test verify accepts valid and rejects invalid signatures."""
+        signature = pkcs1_15.new(rsa_key).sign(Sha256Digest(b"payload"))
+        encoded = base64.b64encode(signature).decode()
+        assert provider.verify("payload", encoded) is True
+        assert provider.verify("tampered", encoded) is False
+
+    def test_private_key_op_loads_key(self, rsa_key):
+        """Test the CRT private-key operation works before the key is loaded."""
+        fresh = RsaCryptoProvider(private_key=rsa_key.export_key(pkcs=8).decode())
+        assert fresh._private_key_op(42) == pow(42, rsa_key.d, rsa_key.n)
+
+    def test_parsed_keys_shared_across_providers(self, provider, rsa_key):
+        """Test providers built from the same PEM reuse the parsed keys."""
+        other = RsaCryptoProvider(
+            private_key=rsa_key.export_key(pkcs=8).decode(),
+            public_key=rsa_key.publickey().export_key().decode(),
+        )
+        assert other._get_private_rsa_key() is provider._get_private_rsa_key()
+        assert other._get_public_rsa_key() is provider._get_public_rsa_key()
@@ -15,29 +15,33 @@ from chainup_custody_sdk.exceptions import (
 )
 
 
-class TestChainUpError:
-    """Tests for ChainUpError base exception."""
-    
-    def test_basic_error(self):
-        """Test basic error creation."""
-        error = ChainUpError("Test error")
-        assert str(error) == "Test error"
-        assert error.message == "Test error"
-        assert error.code is None
-        assert error.details == {}
-    
-    def test_error_with_code(self):
-        """Test error with code."""
-        error = ChainUpError("Test error", code=1001)
-        assert str(error) == "[1001] Test error"
-        assert error.code == 1001
-    
-    def test_error_with_details(self):
-        """Test error with details."""
-        details = {"field": "email", "reason": "invalid"}
-        error = ChainUpError("Test error", details=details)
-        assert error.details == details
-    
+def _attribute(error, name):
+    """Reads an error attribute, with "str" standing for str(error)."""
+    return str(error) if name == "str" else getattr(error, name)
+
+
+class TestErrorAttributes:
+    """Table-driven tests for ChainUpError and ApiError fields."""
+
+    @pytest.mark.parametrize("error_cls,args,kwargs,expected", [
+        (ChainUpError, ("Test error",), {},
+         {"str": "Test error", "message": "Test error", "code": None, "details": {}}),
+        (ChainUpError, ("Test error",), {"code": 1001},
+         {"str": "[1001] Test error", "code": 1001}),
+        (ChainUpError, ("Test error",),
+         {"details": {"field": "email", "reason": "invalid"}},
+         {"details": {"field": "email", "reason": "invalid"}}),
+        (ApiError, ("Invalid request",), {"code": 1001, "http_status": 400},
+         {"message": "Invalid request", "code": 1001, "http_status": 400}),
+        (ApiError, ("Error",), {"request_id": "req-123"},
+         {"request_id": "req-123"}),
+    ])
+    def test_attributes(self, error_cls, args, kwargs, expected):
+        """Test error fields and string form match the constructor arguments."""
+        error = error_cls(*args, **kwargs)
+        for name, value in expected.items():
+            assert _attribute(error, name) == value, name
+
     def test_repr(self):
         """Test error repr."""
         error = ChainUpError("Test error", code=1001)
@@ -45,22 +49,6 @@ class TestChainUpError:
         assert "1001" in repr(error)
 
 
-class TestApiError:
-    """Tests for ApiError exception."""
-    
-    def test_api_error(self):
-        """Test API error creation."""
-        error = ApiError("Invalid request", code=1001, http_status=400)
-        assert error.message == "Invalid request"
-        assert error.code == 1001
-        assert error.http_status == 400
-    
-    def test_api_error_with_request_id(self):
-        """Test API error with request ID."""
-        error = ApiError("Error", request_id="req-123")
-        assert error.request_id == "req-123"
-
-
 class TestConfigError:
     """Tests for ConfigError exception."""
     
@@ -0,0 +1,30 @@
+"""
+Unit tests for JSON utility
+"""
+from decimal import Decimal
+
+import pytest
+
+from chainup_custody_sdk.utils import json_util
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and the stdlib fallback."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_util, "orjson", None)
+    elif json_util.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+class TestJsonUtil:
+    """Tests for json_util."""
+
+    def test_dumps_compact_utf8(self, backend):
+        """Test output is compact and keeps non-ASCII characters."""
+        assert json_util.dumps({"remark": "转账", "n": [1, 2]}) == '{"remark":"转账","n":[1,2]}'
+
+    def test_dumps_decimal_as_string(self, backend):
+        """Test Decimal amounts are serialized as exact strings."""
+        assert json_util.dumps({"amount": Decimal("1.50")}) == '{"amount":"1.50"}'
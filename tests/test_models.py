@@ -1,6 +1,8 @@
 """
 Unit tests for models module
 """
+from types import MappingProxyType
+
 import pytest
 from chainup_custody_sdk.models import (
     ApiResponse,
@@ -15,120 +17,152 @@ from chainup_custody_sdk.models import (
     TransactionSide,
 )
 
+# Read-only from_dict inputs
+_API_RESPONSE_DATA = MappingProxyType({
+    "code": 0,
+    "msg": "success",
+    "data": {"test": True}
+})
+_WALLET_DATA = MappingProxyType({"sub_wallet_id": 1000, "sub_wallet_name": "Test"})
+_NOTIFY_DATA = MappingProxyType({
+    "side": "deposit",
+    "sub_wallet_id": 1000,
+    "symbol": "ETH",
+    "amount": "1.0",
+    "txid": "0xabc123"
+})
+
+
+@pytest.fixture(scope="module")
+def success_response():
+    """Successful API response (read-only, shared by the module)."""
+    return ApiResponse(code=0, msg="success", data={"id": 123})
+
+
+@pytest.fixture(scope="module")
+def error_response():
+    """Error API response (read-only, shared by the module)."""
+    return ApiResponse(code=1001, msg="Invalid parameter")
+
+
+@pytest.fixture(scope="module")
+def wallet():
+    """Wallet info (read-only, shared by the module)."""
+    return WalletInfo(
+        sub_wallet_id=1000,
+        sub_wallet_name="Test Wallet",
+        symbol="ETH",
+        address="0x123"
+    )
+
+
+@pytest.fixture(scope="module")
+def response_from_dict():
+    """ApiResponse built from _API_RESPONSE_DATA."""
+    return ApiResponse.from_dict(_API_RESPONSE_DATA)
+
+
+@pytest.fixture(scope="module")
+def wallet_from_dict():
+    """WalletInfo built from _WALLET_DATA."""
+    return WalletInfo.from_dict(_WALLET_DATA)
+
+
+@pytest.fixture(scope="module")
+def notify_from_dict():
+    """NotifyData built from _NOTIFY_DATA."""
+    return NotifyData.from_dict(_NOTIFY_DATA)
+
+
+@pytest.fixture(scope="module")
+def balance():
+    """Asset balance (read-only, shared by the module)."""
+    return AssetBalance(symbol="ETH", balance="10.5", frozen="0.5")
+
 
 class TestApiResponse:
     """Tests for ApiResponse model."""
     
-    def test_success_response(self):
+    def test_success_response(self, success_response):
         """Test successful API response."""
-        response = ApiResponse(code=0, msg="success", data={"id": 123})
-        assert response.is_success is True
-        assert response.code == 0
-        assert response.data == {"id": 123}
+        assert success_response.is_success is True
+        assert success_response.code == 0
+        assert success_response.data == {"id": 123}
     
-    def test_error_response(self):
+    def test_error_response(self, error_response):
         """Test error API response."""
-        response = ApiResponse(code=1001, msg="Invalid parameter")
-        assert response.is_success is False
-        assert response.code == 1001
+        assert error_response.is_success is False
+        assert error_response.code == 1001
     
-    def test_from_dict(self):
+    def test_from_dict(self, response_from_dict):
         """Test creating from dictionary."""
-        data = {"code": 0, "msg": "success", "data": {"test": True}}
-        response = ApiResponse.from_dict(data)
-        assert response.code == 0
-        assert response.data == {"test": True}
+        assert response_from_dict.code == 0
+        assert response_from_dict.data == {"test": True}
 
 
 class TestWalletInfo:
     """Tests for WalletInfo model."""
     
-    def test_wallet_info(self):
+    def test_wallet_info(self, wallet):
         """Test wallet info creation."""
-        wallet = WalletInfo(
-            sub_wallet_id=1000,
-            sub_wallet_name="Test Wallet",
-            symbol="ETH",
-            address="0x123"
-        )
         assert wallet.sub_wallet_id == 1000
         assert wallet.sub_wallet_name == "Test Wallet"
     
-    def test_from_dict(self):
+    def test_from_dict(self, wallet_from_dict):
         """Test creating from dictionary."""
-        data = {"sub_wallet_id": 1000, "sub_wallet_name": "Test"}
-        wallet = WalletInfo.from_dict(data)
-        assert wallet.sub_wallet_id == 1000
+        assert wallet_from_dict.sub_wallet_id == 1000
 
 
 class TestTransactionRecord:
     """Tests for TransactionRecord model."""
     
-    def test_transaction_record(self):
-        """Test transaction record."""
-        record = TransactionRecord(
-            id=1,
-            request_id="req-123",
-            symbol="ETH",
-            amount="1.5",
-            status=2
-        )
-        assert record.transaction_status == TransactionStatus.SUCCESS
-    
-    def test_unknown_status(self):
-        """Test unknown transaction status."""
+    @pytest.mark.parametrize("status,expected", [
+        (0, TransactionStatus.PENDING),
+        (1, TransactionStatus.PROCESSING),
+        (2, TransactionStatus.SUCCESS),
+        (3, TransactionStatus.FAILED),
+        (4, TransactionStatus.CANCELLED),
+        (999, TransactionStatus.PENDING),
+    ])
+    def test_status_mapping(self, status, expected):
+        """Test status codes map to enum members (unknown codes to PENDING)."""
         record = TransactionRecord(
             id=1,
             request_id="req-123",
             symbol="ETH",
             amount="1.5",
-            status=999
+            status=status
         )
-        assert record.transaction_status == TransactionStatus.PENDING
+        assert record.transaction_status is expected
 
 
 class TestNotifyData:
     """Tests for NotifyData model."""
     
-    def test_deposit_notification(self):
-        """Test deposit notification."""
-        notify = NotifyData(
-            side="deposit",
-            sub_wallet_id=1000,
-            symbol="ETH",
-            amount="1.0"
-        )
-        assert notify.transaction_side == TransactionSide.DEPOSIT
-    
-    def test_withdraw_notification(self):
-        """Test withdraw notification."""
+    @pytest.mark.parametrize("side,symbol,amount,expected", [
+        ("deposit", "ETH", "1.0", TransactionSide.DEPOSIT),
+        ("withdraw", "BTC", "0.5", TransactionSide.WITHDRAW),
+    ])
+    def test_notification_side(self, side, symbol, amount, expected):
+        """Test the notification side maps to its enum member."""
         notify = NotifyData(
-            side="withdraw",
+            side=side,
             sub_wallet_id=1000,
-            symbol="BTC",
-            amount="0.5"
+            symbol=symbol,
+            amount=amount
         )
-        assert notify.transaction_side == TransactionSide.WITHDRAW
+        assert notify.transaction_side is expected
     
-    def test_from_dict(self):
+    def test_from_dict(self, notify_from_dict):
         """Test creating from dictionary."""
-        data = {
-            "side": "deposit",
-            "sub_wallet_id": 1000,
-            "symbol": "ETH",
-            "amount": "1.0",
-            "txid": "0xabc123"
-        }
-        notify = NotifyData.from_dict(data)
-        assert notify.txid == "0xabc123"
+        assert notify_from_dict.txid == "0xabc123"
 
 
 class TestAssetBalance:
     """Tests for AssetBalance model."""
     
-    def test_asset_balance(self):
+    def test_asset_balance(self, balance):
         """Test asset balance."""
-        balance = AssetBalance(symbol="ETH", balance="10.5", frozen="0.5")
         assert balance.symbol == "ETH"
         assert balance.balance == "10.5"
         assert balance.frozen == "0.5"
@@ -0,0 +1,199 @@
+"""
+Unit tests for TTL response cache
+"""
+import pytest
+from unittest.mock import patch
+from chainup_custody_sdk import WaasClient, MpcClient
+from chainup_custody_sdk.utils.redis_cache import RedisCache
+from chainup_custody_sdk.utils.ttl_cache import TTLCache, first_page_key
+
+
+class FakeTimer:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for redis.Redis (get/set/delete)."""
+
+    def __init__(self, fail=False):
+        self.data = {}
+        self.fail = fail
+
+    def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.data.get(key)
+
+    def set(self, key, value, px=None):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_expiry(self):
+        """Test entries expire after their TTL."""
+        timer = FakeTimer()
+        cache = TTLCache(timer=timer)
+        cache.set("k", "v", ttl=10)
+        assert cache.get("k") == "v"
+        timer.now = 10
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        """Test least recently used entry is evicted at maxsize."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+
+class TestCachedResponse:
+    """Tests for cached API responses."""
+
+    def _build(self, cache_responses):
+        return (
+            WaasClient.builder()
+            .set_app_id("test")
+            .set_private_key("key")
+            .set_public_key("key")
+            .set_cache_responses(cache_responses)
+            .build()
+        )
+
+    def test_cache_shared_across_api_instances(self):
+        """Test cached coin list is reused and returned as a copy."""
+        client = self._build(True)
+        response = {"code": 0, "data": [{"symbol": "ETH"}]}
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value=response) as post:
+            first = client.get_coin_api().get_coin_list()
+            first.append({"symbol": "BTC"})
+            second = client.get_coin_api().get_coin_list()
+        assert post.call_count == 1
+        assert second == [{"symbol": "ETH"}]
+
+    def test_cache_disabled_by_default(self):
+        """Test every call hits the API when caching is disabled."""
+        client = self._build(False)
+        response = {"code": 0, "data": []}
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value=response) as post:
+            client.get_coin_api().get_coin_list()
+            client.get_coin_api().get_coin_list()
+        assert post.call_count == 2
+
+    def test_user_lookup_invalidated_on_register(self):
+        """Test registering a user drops the cached lookup for that email."""
+        client = self._build(True)
+        user_api = client.get_user_api()
+        response = {"code": 0, "data": {"uid": 1}}
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value=response) as post:
+            user_api.get_email_user({"email": "a@example.com"})
+            user_api.get_email_user({"email": "a@example.com"})
+            assert post.call_count == 1
+            user_api.register_email_user({"email": "a@example.com"})
+            user_api.get_email_user({"email": "a@example.com"})
+        assert post.call_count == 3
+
+    def test_sync_caches_first_page_only(self):
+        """Test only the max_id=0 page of a sync endpoint is cached."""
+        client = self._build(True)
+        account_api = client.get_account_api()
+        response = {"code": 0, "data": []}
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value=response) as post:
+            account_api.sync_user_address_list(0)
+            account_api.sync_user_address_list(0)
+            assert post.call_count == 1
+            account_api.sync_user_address_list(5)
+            account_api.sync_user_address_list(5)
+        assert post.call_count == 3
+        assert len(account_api.response_cache) == 1
+
+    def test_first_page_key_skips_later_pages(self):
+        """Test first_page_key returns None (do not cache) for later pages."""
+        key = first_page_key("sync_deposit_list")
+        assert key() == key(0) == ("sync_deposit_list", 0)
+        assert key(7) is None
+
+    def test_later_sync_page_not_cached(self):
+        """Test a non-first billing sync page is fetched on every call."""
+        client = self._build(True)
+        billing_api = client.get_billing_api()
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value={"code": 0, "data": [{"id": 8}]}) as post:
+            billing_api.sync_deposit_list(7)
+            billing_api.sync_deposit_list(7)
+        assert post.call_count == 2
+        assert len(billing_api.response_cache) == 0
+
+
+class TestRedisCache:
+    """Tests for the Redis-backed response cache."""
+
+    def test_roundtrip_with_frozen_key(self):
+        """Test values survive JSON encoding under a deterministic key."""
+        cache = RedisCache(FakeRedis())
+        key = ("get_coin_list", frozenset({("b", 2), ("a", 1)}))
+        cache.set(key, [{"symbol": "ETH"}], ttl=60)
+        assert cache.get(("get_coin_list", frozenset({("a", 1), ("b", 2)}))) == [
+            {"symbol": "ETH"}
+        ]
+
+    def test_corrupt_value_is_a_miss(self):
+        """Test a value that is not valid JSON is treated as a miss."""
+        redis_client = FakeRedis()
+        cache = RedisCache(redis_client)
+        redis_client.data[cache._key("coins")] = b"{not json"
+        assert cache.get("coins", "missing") == "missing"
+
+    def test_redis_error_is_a_miss(self):
+        """Test an unavailable Redis falls back to calling the API."""
+        client = (
+            MpcClient.builder()
+            .set_app_id("test")
+            .set_rsa_private_key("key")
+            .set_redis_client(FakeRedis(fail=True))
+            .build()
+        )
+        response = {"code": 0, "data": {"height": 1}}
+        with patch("chainup_custody_sdk.mpc.api.mpc_base_api.MpcBaseApi.get",
+                   return_value=response) as get:
+            workspace_api = client.get_workspace_api()
+            workspace_api.get_last_block_height({"base_symbol": "ETH"})
+            workspace_api.get_last_block_height({"base_symbol": "ETH"})
+        assert get.call_count == 2
+
+    def test_shared_across_clients(self):
+        """Test clients with the same Redis and app ID share cached responses."""
+        redis_client = FakeRedis()
+        response = {"code": 0, "data": [{"symbol": "ETH"}]}
+        with patch("chainup_custody_sdk.waas.api.base_api.BaseApi.post",
+                   return_value=response) as post:
+            for _ in range(2):
+                client = (
+                    WaasClient.builder()
+                    .set_app_id("test")
+                    .set_private_key("key")
+                    .set_public_key("key")
+                    .set_redis_client(redis_client)
+                    .build()
+                )
+                assert client.get_coin_api().get_coin_list() == [{"symbol": "ETH"}]
+        assert post.call_count == 1